@@ -1,11 +1,53 @@
 """Switch inventory management for Cisco MCP server."""
 
+import mmap
 import os
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from cisco_mcp.models import Switch, SwitchInventory, SwitchRole
 
+# Map role strings from switches.txt to enum members
+_ROLE_MAP = {
+    "spine": SwitchRole.SPINE,
+    "leaf": SwitchRole.LEAF,
+    "border": SwitchRole.BORDER,
+}
+
+# Roles counted as leafs (ToR and border)
+_LEAF_ROLES = frozenset((SwitchRole.LEAF, SwitchRole.BORDER))
+
+
+def _iter_mapped_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the raw lines of an open binary file through a read-only mmap.
+
+    The OS pages the file in on demand instead of copying it through a
+    buffered text reader. Empty files cannot be mapped and yield nothing.
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b"")
+
+
+def _render_inventory_markdown(inv: SwitchInventory) -> str:
+    """Render the inventory summary and switch table as markdown."""
+    header = (
+        "# TIG Network Switch Inventory\n\n"
+        f"Total Switches: {inv.total_count}\n"
+        f"- Spines: {inv.spine_count}\n"
+        f"- Leafs: {inv.leaf_count}\n"
+        f"- Border Leafs: {inv.border_count}\n\n"
+        "## Switches\n\n"
+        "| Hostname | IP | Role | Rack |\n"
+        "|----------|-------|------|------|"
+    )
+    rows = [
+        f"| {s.hostname} | {s.ip} | {s.role.value} | {s.rack} |" for s in inv.switches
+    ]
+    return "\n".join([header, *rows])
+
 
 class SwitchInventoryManager:
     """Manages the switch inventory loaded from switches.txt."""
@@ -23,6 +65,16 @@ class SwitchInventoryManager:
 
         self.inventory_file = inventory_file
         self._switches: list[Switch] = []
+        self._by_hostname: dict[str, Switch] = {}
+        self._by_short: dict[str, Switch] = {}
+        self._by_ip: dict[str, Switch] = {}
+        self._by_role: dict[SwitchRole, tuple[Switch, ...]] = {}
+        self._by_rack: dict[str, tuple[Switch, ...]] = {}
+        self._leafs: tuple[Switch, ...] = ()
+        self._hostnames: tuple[str, ...] = ()
+        self._ips: tuple[str, ...] = ()
+        self._inventory_obj: Optional[SwitchInventory] = None
+        self._inventory_markdown = ""
         self._loaded = False
 
     def load(self) -> None:
@@ -32,70 +84,107 @@ class SwitchInventoryManager:
         if not os.path.exists(self.inventory_file):
             raise FileNotFoundError(f"Inventory file not found: {self.inventory_file}")
 
-        with open(self.inventory_file) as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
+        with open(self.inventory_file, "rb") as f:
+            for raw in _iter_mapped_lines(f):
+                # A single split() trims and tokenizes the line; blank lines,
+                # comments and rows without a hostname are skipped
+                parts = raw.decode("utf-8").split()
+                if len(parts) < 2 or parts[0][0] == "#":
                     continue
 
-                parts = line.split()
-                if len(parts) >= 2:
-                    ip = parts[0]
-                    hostname = parts[1]
-
-                    # Determine role from parts or hostname
-                    if len(parts) >= 3:
-                        role_str = parts[2].lower()
+                ip = parts[0]
+                hostname = parts[1]
+
+                # Determine role from parts or hostname
+                if len(parts) >= 3:
+                    role_str = parts[2].lower()
+                else:
+                    # Infer from hostname
+                    hostname_lower = hostname.lower()
+                    if hostname_lower.startswith("ss"):
+                        role_str = "spine"
+                    elif hostname_lower.startswith("bl"):
+                        role_str = "border"
                     else:
-                        # Infer from hostname
-                        hostname_lower = hostname.lower()
-                        if hostname_lower.startswith("ss"):
-                            role_str = "spine"
-                        elif hostname_lower.startswith("bl"):
-                            role_str = "border"
-                        else:
-                            role_str = "leaf"
-
-                    # Map role string to enum
-                    role_map = {
-                        "spine": SwitchRole.SPINE,
-                        "leaf": SwitchRole.LEAF,
-                        "border": SwitchRole.BORDER,
-                    }
-                    role = role_map.get(role_str, SwitchRole.LEAF)
-
-                    # Get rack from parts or extract from hostname
-                    if len(parts) >= 4:
-                        rack = parts[3]
-                    else:
-                        # Extract rack from hostname (e.g., LS1a-TIG-6A7 -> 6A7)
-                        rack_parts = hostname.split("-")
-                        rack = rack_parts[-1] if len(rack_parts) > 1 else "unknown"
+                        role_str = "leaf"
+
+                # Map role string to enum
+                role = _ROLE_MAP.get(role_str, SwitchRole.LEAF)
 
-                    self._switches.append(
-                        Switch(hostname=hostname, ip=ip, role=role, rack=rack)
-                    )
+                # Get rack from parts or extract from hostname
+                if len(parts) >= 4:
+                    rack = parts[3]
+                else:
+                    # Extract rack from hostname (e.g., LS1a-TIG-6A7 -> 6A7)
+                    _, sep, suffix = hostname.rpartition("-")
+                    rack = suffix if sep else "unknown"
 
+                # Fields are already typed str/SwitchRole, so skip validation
+                self._switches.append(
+                    Switch.model_construct(hostname=hostname, ip=ip, role=role, rack=rack)
+                )
+
+        self._build_indexes()
         self._loaded = True
 
+    def _build_indexes(self) -> None:
+        """Rebuild lookup indexes and cached views from the loaded switches.
+
+        The first switch wins when several share a key, matching the order
+        of a linear scan over the inventory file.
+        """
+        self._by_hostname = {}
+        self._by_short = {}
+        self._by_ip = {}
+        by_role: dict[SwitchRole, list[Switch]] = {}
+        by_rack: dict[str, list[Switch]] = {}
+
+        # Name and rack keys are stored lowercased so lookups lower only the query
+        for switch in self._switches:
+            self._by_hostname.setdefault(switch.hostname.lower(), switch)
+            self._by_short.setdefault(switch.short_name.lower(), switch)
+            self._by_ip.setdefault(switch.ip, switch)
+            by_role.setdefault(switch.role, []).append(switch)
+            by_rack.setdefault(switch.rack.lower(), []).append(switch)
+
+        # Filtered views are frozen into tuples so getters can hand them out
+        # without copying
+        self._by_role = {role: tuple(group) for role, group in by_role.items()}
+        self._by_rack = {rack: tuple(group) for rack, group in by_rack.items()}
+        self._leafs = tuple(s for s in self._switches if s.role in _LEAF_ROLES)
+        self._hostnames = tuple(s.hostname for s in self._switches)
+        self._ips = tuple(s.ip for s in self._switches)
+
+        # Role counts come straight from the role index built above
+        self._inventory_obj = SwitchInventory(
+            switches=self._switches,
+            total_count=len(self._switches),
+            spine_count=len(by_role.get(SwitchRole.SPINE, ())),
+            leaf_count=len(by_role.get(SwitchRole.LEAF, ())),
+            border_count=len(by_role.get(SwitchRole.BORDER, ())),
+        )
+        self._inventory_markdown = _render_inventory_markdown(self._inventory_obj)
+
+    def _ensure_loaded(self) -> None:
+        """Load the inventory on first use."""
+        if not self._loaded:
+            self.load()
+
     @property
     def switches(self) -> list[Switch]:
         """Get all switches, loading if necessary."""
-        if not self._loaded:
-            self.load()
+        self._ensure_loaded()
         return self._switches
 
     def get_inventory(self) -> SwitchInventory:
         """Get the complete switch inventory as a structured object."""
-        switches = self.switches
-        return SwitchInventory(
-            switches=switches,
-            total_count=len(switches),
-            spine_count=len([s for s in switches if s.role == SwitchRole.SPINE]),
-            leaf_count=len([s for s in switches if s.role == SwitchRole.LEAF]),
-            border_count=len([s for s in switches if s.role == SwitchRole.BORDER]),
-        )
+        self._ensure_loaded()
+        return self._inventory_obj
+
+    def get_inventory_markdown(self) -> str:
+        """Get the inventory rendered as a markdown table."""
+        self._ensure_loaded()
+        return self._inventory_markdown
 
     def get_switch_by_name(self, name: str) -> Optional[Switch]:
         """Get a switch by hostname or short name.
@@ -103,57 +192,51 @@ class SwitchInventoryManager:
         Args:
             name: Full hostname or short name (e.g., 'SS1' or 'SS1-TIG-6A21')
         """
+        self._ensure_loaded()
         name_lower = name.lower()
-        for switch in self.switches:
-            if switch.hostname.lower() == name_lower:
-                return switch
-            if switch.short_name.lower() == name_lower:
-                return switch
-        return None
+        return self._by_hostname.get(name_lower) or self._by_short.get(name_lower)
 
     def get_switch_by_ip(self, ip: str) -> Optional[Switch]:
         """Get a switch by IP address."""
-        for switch in self.switches:
-            if switch.ip == ip:
-                return switch
-        return None
+        self._ensure_loaded()
+        return self._by_ip.get(ip)
 
-    def get_switches_by_role(self, role: SwitchRole) -> list[Switch]:
+    def get_switches_by_role(self, role: SwitchRole) -> tuple[Switch, ...]:
         """Get all switches with a specific role."""
-        return [s for s in self.switches if s.role == role]
+        self._ensure_loaded()
+        return self._by_role.get(role, ())
 
-    def get_switches_by_rack(self, rack: str) -> list[Switch]:
+    def get_switches_by_rack(self, rack: str) -> tuple[Switch, ...]:
         """Get all switches in a specific rack."""
-        rack_lower = rack.lower()
-        return [s for s in self.switches if s.rack.lower() == rack_lower]
+        self._ensure_loaded()
+        return self._by_rack.get(rack.lower(), ())
 
-    def get_spines(self) -> list[Switch]:
+    def get_spines(self) -> tuple[Switch, ...]:
         """Get all spine switches."""
         return self.get_switches_by_role(SwitchRole.SPINE)
 
-    def get_leafs(self) -> list[Switch]:
+    def get_leafs(self) -> tuple[Switch, ...]:
         """Get all leaf switches (including border leafs)."""
-        return [
-            s
-            for s in self.switches
-            if s.role in (SwitchRole.LEAF, SwitchRole.BORDER)
-        ]
+        self._ensure_loaded()
+        return self._leafs
 
-    def get_border_leafs(self) -> list[Switch]:
+    def get_border_leafs(self) -> tuple[Switch, ...]:
         """Get all border leaf switches."""
         return self.get_switches_by_role(SwitchRole.BORDER)
 
-    def get_tor_leafs(self) -> list[Switch]:
+    def get_tor_leafs(self) -> tuple[Switch, ...]:
         """Get all ToR leaf switches (excluding border leafs)."""
         return self.get_switches_by_role(SwitchRole.LEAF)
 
-    def get_all_hostnames(self) -> list[str]:
-        """Get list of all switch hostnames."""
-        return [s.hostname for s in self.switches]
+    def get_all_hostnames(self) -> tuple[str, ...]:
+        """Get all switch hostnames."""
+        self._ensure_loaded()
+        return self._hostnames
 
-    def get_all_ips(self) -> list[str]:
-        """Get list of all switch IPs."""
-        return [s.ip for s in self.switches]
+    def get_all_ips(self) -> tuple[str, ...]:
+        """Get all switch IPs."""
+        self._ensure_loaded()
+        return self._ips
 
 
 # Global inventory instance
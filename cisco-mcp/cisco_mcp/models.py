@@ -1,7 +1,9 @@
 """Pydantic models for structured output from Cisco MCP tools."""
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, Field
 
@@ -22,10 +24,10 @@ class Switch(BaseModel):
     role: SwitchRole = Field(description="Switch role (spine, leaf, border)")
     rack: str = Field(description="Rack location")
 
-    @property
+    @cached_property
     def short_name(self) -> str:
-        """Return short name without TIG suffix."""
-        return self.hostname.split("-TIG-")[0] if "-TIG-" in self.hostname else self.hostname
+        """Return short name without TIG suffix (computed once per switch)."""
+        return self.hostname.partition("-TIG-")[0]
 
 
 class SwitchInventory(BaseModel):
@@ -70,16 +72,17 @@ class OSPFNeighborState(str, Enum):
     FULL = "FULL"
 
 
-class OSPFNeighbor(BaseModel):
+@dataclass(slots=True)
+class OSPFNeighbor:
     """An OSPF neighbor."""
 
-    neighbor_id: str = Field(description="OSPF neighbor router ID")
-    priority: int = Field(description="Neighbor priority")
-    state: str = Field(description="OSPF state (e.g., FULL)")
-    dead_time: str = Field(description="Dead time remaining")
-    address: str = Field(description="Neighbor IP address")
-    interface: str = Field(description="Local interface")
-    is_healthy: bool = Field(description="Whether neighbor is in FULL state")
+    neighbor_id: Annotated[str, Field(description="OSPF neighbor router ID")]
+    priority: Annotated[int, Field(description="Neighbor priority")]
+    state: Annotated[str, Field(description="OSPF state (e.g., FULL)")]
+    dead_time: Annotated[str, Field(description="Dead time remaining")]
+    address: Annotated[str, Field(description="Neighbor IP address")]
+    interface: Annotated[str, Field(description="Local interface")]
+    is_healthy: Annotated[bool, Field(description="Whether neighbor is in FULL state")]
 
 
 class OSPFNeighborsResult(BaseModel):
@@ -90,18 +93,22 @@ class OSPFNeighborsResult(BaseModel):
     total_count: int = Field(description="Total number of neighbors")
     full_count: int = Field(description="Number of neighbors in FULL state")
     problem_count: int = Field(description="Number of neighbors not in FULL state")
-    raw_output: str = Field(description="Raw command output")
+    raw_output: Optional[str] = Field(
+        default=None,
+        description="Raw command output (only when requested) or error details",
+    )
 
 
-class BGPNeighbor(BaseModel):
+@dataclass(slots=True)
+class BGPNeighbor:
     """A BGP EVPN neighbor."""
 
-    neighbor_id: str = Field(description="BGP neighbor IP")
-    asn: int = Field(description="Remote AS number")
-    state: str = Field(description="BGP state (e.g., Established)")
-    prefixes_received: int = Field(description="Number of prefixes received")
-    up_time: str = Field(description="Time since established")
-    is_established: bool = Field(description="Whether session is established")
+    neighbor_id: Annotated[str, Field(description="BGP neighbor IP")]
+    asn: Annotated[int, Field(description="Remote AS number")]
+    state: Annotated[str, Field(description="BGP state (e.g., Established)")]
+    prefixes_received: Annotated[int, Field(description="Number of prefixes received")]
+    up_time: Annotated[str, Field(description="Time since established")]
+    is_established: Annotated[bool, Field(description="Whether session is established")]
 
 
 class BGPEVPNResult(BaseModel):
@@ -113,7 +120,10 @@ class BGPEVPNResult(BaseModel):
     total_count: int = Field(description="Total number of neighbors")
     established_count: int = Field(description="Number of established sessions")
     problem_count: int = Field(description="Number of non-established sessions")
-    raw_output: str = Field(description="Raw command output")
+    raw_output: Optional[str] = Field(
+        default=None,
+        description="Raw command output (only when requested) or error details",
+    )
 
 
 class VPCPeerState(str, Enum):
@@ -135,17 +145,21 @@ class VPCStatus(BaseModel):
     peer_link_status: str = Field(description="Peer link status")
     vpc_count: int = Field(description="Number of vPCs")
     is_healthy: bool = Field(description="Whether vPC is healthy")
-    raw_output: str = Field(description="Raw command output")
+    raw_output: Optional[str] = Field(
+        default=None,
+        description="Raw command output (only when requested) or error details",
+    )
 
 
-class NVEPeer(BaseModel):
+@dataclass(slots=True)
+class NVEPeer:
     """An NVE (VXLAN) peer."""
 
-    peer_ip: str = Field(description="Peer VTEP IP")
-    state: str = Field(description="Peer state")
-    learn_type: str = Field(description="Learning type (CP/DP)")
-    uptime: str = Field(description="Time since up")
-    is_up: bool = Field(description="Whether peer is up")
+    peer_ip: Annotated[str, Field(description="Peer VTEP IP")]
+    state: Annotated[str, Field(description="Peer state")]
+    learn_type: Annotated[str, Field(description="Learning type (CP/DP)")]
+    uptime: Annotated[str, Field(description="Time since up")]
+    is_up: Annotated[bool, Field(description="Whether peer is up")]
 
 
 class NVEPeersResult(BaseModel):
@@ -156,29 +170,34 @@ class NVEPeersResult(BaseModel):
     total_count: int = Field(description="Total number of peers")
     up_count: int = Field(description="Number of up peers")
     down_count: int = Field(description="Number of down peers")
-    raw_output: str = Field(description="Raw command output")
+    raw_output: Optional[str] = Field(
+        default=None,
+        description="Raw command output (only when requested) or error details",
+    )
 
 
-class InterfaceStatus(BaseModel):
+@dataclass(slots=True)
+class InterfaceStatus:
     """Status of a network interface."""
 
-    name: str = Field(description="Interface name")
-    admin_state: str = Field(description="Administrative state")
-    oper_state: str = Field(description="Operational state")
-    speed: str = Field(description="Interface speed")
-    type: str = Field(description="Interface type")
+    name: Annotated[str, Field(description="Interface name")]
+    admin_state: Annotated[str, Field(description="Administrative state")]
+    oper_state: Annotated[str, Field(description="Operational state")]
+    speed: Annotated[str, Field(description="Interface speed")]
+    type: Annotated[str, Field(description="Interface type")]
 
 
-class InterfaceErrors(BaseModel):
+@dataclass(slots=True)
+class InterfaceErrors:
     """Error counters for an interface."""
 
-    name: str = Field(description="Interface name")
-    input_errors: int = Field(description="Input errors")
-    output_errors: int = Field(description="Output errors")
-    crc_errors: int = Field(description="CRC errors")
-    input_discards: int = Field(description="Input discards")
-    output_discards: int = Field(description="Output discards")
-    has_errors: bool = Field(description="Whether interface has errors")
+    name: Annotated[str, Field(description="Interface name")]
+    input_errors: Annotated[int, Field(description="Input errors")]
+    output_errors: Annotated[int, Field(description="Output errors")]
+    crc_errors: Annotated[int, Field(description="CRC errors")]
+    input_discards: Annotated[int, Field(description="Input discards")]
+    output_discards: Annotated[int, Field(description="Output discards")]
+    has_errors: Annotated[bool, Field(description="Whether interface has errors")]
 
 
 class InterfaceErrorsResult(BaseModel):
@@ -187,7 +206,10 @@ class InterfaceErrorsResult(BaseModel):
     switch: str = Field(description="Switch hostname")
     interfaces: list[InterfaceErrors] = Field(description="List of interfaces with counters")
     interfaces_with_errors: int = Field(description="Number of interfaces with errors")
-    raw_output: str = Field(description="Raw command output")
+    raw_output: Optional[str] = Field(
+        default=None,
+        description="Raw command output (only when requested) or error details",
+    )
 
 
 class SwitchStatus(BaseModel):
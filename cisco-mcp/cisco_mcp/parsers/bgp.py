@@ -1,11 +1,32 @@
 """Parser for BGP EVPN command output."""
 
 import re
-
-from cisco_mcp.models import BGPNeighbor, BGPEVPNResult
-
-
-def parse_bgp_evpn_summary(output: str, switch_name: str) -> BGPEVPNResult:
+import sys
+
+from cisco_mcp.models import BGPEVPNResult
+
+_LOCAL_ASN_RE = re.compile(r"local AS number (\d+)")
+
+# Pattern to match neighbor lines
+# Neighbor        V    AS    MsgRcvd    MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+_NEIGHBOR_RE = re.compile(
+    r"^[ \t]*(\d+\.\d+\.\d+\.\d+)[ \t]+"  # Neighbor IP
+    r"(\d+)[ \t]+"  # Version
+    r"(\d+)[ \t]+"  # AS number
+    r"(\d+)[ \t]+"  # MsgRcvd
+    r"(\d+)[ \t]+"  # MsgSent
+    r"(\d+)[ \t]+"  # TblVer
+    r"(\d+)[ \t]+"  # InQ
+    r"(\d+)[ \t]+"  # OutQ
+    r"(\S+)[ \t]+"  # Up/Down time
+    r"(\S+)",  # State/PfxRcd
+    re.MULTILINE,
+)
+
+
+def parse_bgp_evpn_summary(
+    output: str, switch_name: str, include_raw: bool = False
+) -> BGPEVPNResult:
     """Parse 'show bgp l2vpn evpn summary' output.
 
     Example output format:
@@ -20,74 +41,62 @@ def parse_bgp_evpn_summary(output: str, switch_name: str) -> BGPEVPNResult:
     Args:
         output: Raw command output.
         switch_name: Name of the switch for result labeling.
+        include_raw: Keep the raw output on the result (off by default to
+            avoid holding a second copy of large outputs).
 
     Returns:
         Parsed BGP EVPN summary result.
     """
-    neighbors: list[BGPNeighbor] = []
+    # Rows are collected as plain dicts and validated in one pass at the end
+    neighbors: list[dict] = []
     local_asn = 0
+    established_count = 0
 
     # Extract local AS number
-    asn_match = re.search(r"local AS number (\d+)", output)
+    asn_match = _LOCAL_ASN_RE.search(output)
     if asn_match:
         local_asn = int(asn_match.group(1))
 
-    # Pattern to match neighbor lines
-    # Neighbor        V    AS    MsgRcvd    MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-    neighbor_pattern = re.compile(
-        r"(\d+\.\d+\.\d+\.\d+)\s+"  # Neighbor IP
-        r"(\d+)\s+"  # Version
-        r"(\d+)\s+"  # AS number
-        r"(\d+)\s+"  # MsgRcvd
-        r"(\d+)\s+"  # MsgSent
-        r"(\d+)\s+"  # TblVer
-        r"(\d+)\s+"  # InQ
-        r"(\d+)\s+"  # OutQ
-        r"(\S+)\s+"  # Up/Down time
-        r"(\S+)"  # State/PfxRcd
-    )
-
-    for line in output.splitlines():
-        line = line.strip()
-        match = neighbor_pattern.match(line)
-        if match:
-            neighbor_id = match.group(1)
-            asn = int(match.group(3))
-            up_time = match.group(9)
-            state_or_pfx = match.group(10)
-
-            # If state_or_pfx is a number, session is established
-            try:
-                prefixes_received = int(state_or_pfx)
-                state = "Established"
-                is_established = True
-            except ValueError:
-                prefixes_received = 0
-                state = state_or_pfx
-                is_established = False
-
-            neighbors.append(
-                BGPNeighbor(
-                    neighbor_id=neighbor_id,
-                    asn=asn,
-                    state=state,
-                    prefixes_received=prefixes_received,
-                    up_time=up_time,
-                    is_established=is_established,
-                )
-            )
+    for match in _NEIGHBOR_RE.finditer(output):
+        neighbor_id = match.group(1)
+        asn = int(match.group(3))
+        up_time = match.group(9)
+        state_or_pfx = match.group(10)
+
+        # If state_or_pfx is a number, session is established
+        try:
+            prefixes_received = int(state_or_pfx)
+            state = "Established"
+            is_established = True
+            established_count += 1
+        except ValueError:
+            prefixes_received = 0
+            state = sys.intern(state_or_pfx)
+            is_established = False
+
+        neighbors.append(
+            {
+                "neighbor_id": neighbor_id,
+                "asn": asn,
+                "state": state,
+                "prefixes_received": prefixes_received,
+                "up_time": up_time,
+                "is_established": is_established,
+            }
+        )
 
-    established_count = len([n for n in neighbors if n.is_established])
     problem_count = len(neighbors) - established_count
 
-    return BGPEVPNResult(
-        switch=switch_name,
-        local_asn=local_asn,
-        neighbors=neighbors,
-        total_count=len(neighbors),
-        established_count=established_count,
-        problem_count=problem_count,
-        raw_output=output,
+    return BGPEVPNResult.model_validate(
+        {
+            "switch": switch_name,
+            "local_asn": local_asn,
+            "neighbors": neighbors,
+            "total_count": len(neighbors),
+            "established_count": established_count,
+            "problem_count": problem_count,
+            "raw_output": output if include_raw else None,
+        }
     )
 
 
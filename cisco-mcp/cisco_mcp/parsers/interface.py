@@ -1,8 +1,32 @@
 """Parser for interface command output."""
 
 import re
-
-from cisco_mcp.models import InterfaceErrors, InterfaceErrorsResult, InterfaceStatus
+import sys
+
+from cisco_mcp.models import InterfaceErrorsResult, InterfaceStatus
+
+# Pattern for ethernet interfaces
+_ETH_RE = re.compile(
+    r"\s*(Eth\d+/\d+(?:/\d+)?)\s+"  # Interface name
+    r"(\S+)\s+"  # VLAN or --
+    r"(\S+)\s+"  # Type
+    r"(\S+)\s+"  # Mode
+    r"(\S+)\s+"  # Status (up/down)
+    r"(.+?)\s+"  # Reason
+    r"(\S+)"  # Speed
+)
+
+# Pattern to match error counter lines
+# The format varies, but typically: Interface followed by six counters, or two
+# in the shorter tables. The six-counter branch is tried first.
+_COUNTERS_RE = re.compile(
+    r"^[ \t]*(?P<iface>Eth\d+/\d+(?:/\d+)?|Po\d+)[ \t]+"  # Interface name
+    r"(?P<counters>"
+    r"\d+(?:[ \t]+\d+){5}"  # Six counters
+    r"|\d+[ \t]+\d+"  # Two counters
+    r")",
+    re.MULTILINE,
+)
 
 
 def parse_interface_brief(output: str) -> list[InterfaceStatus]:
@@ -25,57 +49,43 @@ def parse_interface_brief(output: str) -> list[InterfaceStatus]:
     """
     interfaces: list[InterfaceStatus] = []
 
-    # Pattern for ethernet interfaces
-    eth_pattern = re.compile(
-        r"(Eth\d+/\d+(?:/\d+)?)\s+"  # Interface name
-        r"(\S+)\s+"  # VLAN or --
-        r"(\S+)\s+"  # Type
-        r"(\S+)\s+"  # Mode
-        r"(\S+)\s+"  # Status (up/down)
-        r"(.+?)\s+"  # Reason
-        r"(\S+)"  # Speed
-    )
-
-    # Pattern for port-channels
-    po_pattern = re.compile(
-        r"(Po\d+)\s+"  # Port-channel name
-        r"(\S+)\s+"  # VLAN or --
-        r"(\S+)\s+"  # Type
-        r"(\S+)"  # Status (up/down)
-    )
-
+    # The Ethernet pattern skips leading whitespace itself, so lines are not stripped
     for line in output.splitlines():
-        line = line.strip()
-
-        eth_match = eth_pattern.match(line)
+        eth_match = _ETH_RE.match(line)
         if eth_match:
             interfaces.append(
                 InterfaceStatus(
                     name=eth_match.group(1),
                     admin_state="up" if "admin" not in eth_match.group(6).lower() else "down",
-                    oper_state=eth_match.group(5),
+                    oper_state=sys.intern(eth_match.group(5)),
                     speed=eth_match.group(7),
-                    type=eth_match.group(3),
+                    type=sys.intern(eth_match.group(3)),
                 )
             )
             continue
 
-        po_match = po_pattern.match(line)
-        if po_match:
+        # Port-channel rows: Po500  1  eth  trunk  up ...
+        if "Po" not in line:
+            continue
+
+        parts = line.split()
+        if len(parts) >= 4 and parts[0].startswith("Po") and parts[0][2:].isdigit():
             interfaces.append(
                 InterfaceStatus(
-                    name=po_match.group(1),
+                    name=parts[0],
                     admin_state="up",
-                    oper_state=po_match.group(4),
+                    oper_state=sys.intern(parts[3]),
                     speed="aggregated",
-                    type=po_match.group(3),
+                    type=sys.intern(parts[2]),
                 )
             )
 
     return interfaces
 
 
-def parse_interface_counters(output: str, switch_name: str) -> InterfaceErrorsResult:
+def parse_interface_counters(
+    output: str, switch_name: str, include_raw: bool = False
+) -> InterfaceErrorsResult:
     """Parse 'show interface counters errors' output.
 
     Example output format:
@@ -100,86 +110,47 @@ def parse_interface_counters(output: str, switch_name: str) -> InterfaceErrorsRe
     Args:
         output: Raw command output.
         switch_name: Name of the switch for result labeling.
+        include_raw: Keep the raw output on the result (off by default to
+            avoid holding a second copy of large outputs).
 
     Returns:
         Parsed interface errors result.
     """
-    interfaces: dict[str, InterfaceErrors] = {}
-
-    # Pattern to match error counter lines
-    # The format varies, but typically: Interface followed by numbers
-    error_pattern = re.compile(
-        r"(Eth\d+/\d+(?:/\d+)?|Po\d+)\s+"  # Interface name
-        r"(\d+)\s+"  # First counter
-        r"(\d+)\s+"  # Second counter
-        r"(\d+)\s+"  # Third counter
-        r"(\d+)\s+"  # Fourth counter
-        r"(\d+)\s+"  # Fifth counter
-        r"(\d+)"  # Sixth counter
-    )
-
-    # Simpler pattern for lines with fewer counters
-    simple_pattern = re.compile(
-        r"(Eth\d+/\d+(?:/\d+)?|Po\d+)\s+"  # Interface name
-        r"(\d+)\s+"  # First counter
-        r"(\d+)"  # Second counter
-    )
-
-    for line in output.splitlines():
-        line = line.strip()
-
-        match = error_pattern.match(line)
-        if match:
-            name = match.group(1)
-            if name not in interfaces:
-                interfaces[name] = InterfaceErrors(
-                    name=name,
-                    input_errors=0,
-                    output_errors=0,
-                    crc_errors=0,
-                    input_discards=0,
-                    output_discards=0,
-                    has_errors=False,
-                )
-
-            # Accumulate errors from different counter tables
-            # The exact column meanings depend on which section we're in
-            # For simplicity, sum all non-zero values as potential errors
-            for i in range(2, 8):
-                val = int(match.group(i))
-                if val > 0:
-                    interfaces[name].input_errors += val
-                    interfaces[name].has_errors = True
-            continue
-
-        simple_match = simple_pattern.match(line)
-        if simple_match:
-            name = simple_match.group(1)
-            if name not in interfaces:
-                interfaces[name] = InterfaceErrors(
-                    name=name,
-                    input_errors=0,
-                    output_errors=0,
-                    crc_errors=0,
-                    input_discards=0,
-                    output_discards=0,
-                    has_errors=False,
-                )
-
-            val1 = int(simple_match.group(2))
-            val2 = int(simple_match.group(3))
-            if val1 > 0 or val2 > 0:
-                interfaces[name].input_errors += val1 + val2
-                interfaces[name].has_errors = True
-
-    interface_list = list(interfaces.values())
-    interfaces_with_errors = len([i for i in interface_list if i.has_errors])
-
-    return InterfaceErrorsResult(
-        switch=switch_name,
-        interfaces=interface_list,
-        interfaces_with_errors=interfaces_with_errors,
-        raw_output=output,
+    # Rows are accumulated as plain dicts and validated in one pass at the end
+    interfaces: dict[str, dict] = {}
+    interfaces_with_errors = 0
+
+    for match in _COUNTERS_RE.finditer(output):
+        name = match.group("iface")
+        iface = interfaces.get(name)
+        if iface is None:
+            iface = interfaces[name] = {
+                "name": name,
+                "input_errors": 0,
+                "output_errors": 0,
+                "crc_errors": 0,
+                "input_discards": 0,
+                "output_discards": 0,
+                "has_errors": False,
+            }
+
+        # Accumulate errors from different counter tables
+        # The exact column meanings depend on which section we're in
+        # For simplicity, sum all non-zero values as potential errors
+        for val in map(int, match.group("counters").split()):
+            if val > 0:
+                iface["input_errors"] += val
+                if not iface["has_errors"]:
+                    iface["has_errors"] = True
+                    interfaces_with_errors += 1
+
+    return InterfaceErrorsResult.model_validate(
+        {
+            "switch": switch_name,
+            "interfaces": list(interfaces.values()),
+            "interfaces_with_errors": interfaces_with_errors,
+            "raw_output": output if include_raw else None,
+        }
     )
 
 
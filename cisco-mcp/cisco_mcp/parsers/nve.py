@@ -1,11 +1,18 @@
 """Parser for NVE (VXLAN) command output."""
 
-import re
+import sys
 
-from cisco_mcp.models import NVEPeer, NVEPeersResult
+from cisco_mcp.models import NVEPeersResult
 
 
-def parse_nve_peers(output: str, switch_name: str) -> NVEPeersResult:
+def _looks_like_ipv4(value: str) -> bool:
+    """Return True if value is a dotted quad of digit-only octets."""
+    return value.count(".") == 3 and all(part.isdigit() for part in value.split("."))
+
+
+def parse_nve_peers(
+    output: str, switch_name: str, include_raw: bool = False
+) -> NVEPeersResult:
     """Parse 'show nve peers' output.
 
     Example output format:
@@ -18,53 +25,61 @@ def parse_nve_peers(output: str, switch_name: str) -> NVEPeersResult:
     Args:
         output: Raw command output.
         switch_name: Name of the switch for result labeling.
+        include_raw: Keep the raw output on the result (off by default to
+            avoid holding a second copy of large outputs).
 
     Returns:
         Parsed NVE peers result.
     """
-    peers: list[NVEPeer] = []
+    # Rows are collected as plain dicts and validated in one pass at the end
+    peers: list[dict] = []
+    up_count = 0
 
-    # Pattern to match peer lines
+    # Peer rows are fixed columns starting with the NVE interface name
     # nve1      192.168.1.1      Up    CP        2d03h    5254.0012.3456
-    peer_pattern = re.compile(
-        r"nve\d+\s+"  # Interface (nve1, etc.)
-        r"(\d+\.\d+\.\d+\.\d+)\s+"  # Peer IP
-        r"(\S+)\s+"  # State (Up/Down)
-        r"(\S+)\s+"  # LearnType (CP/DP)
-        r"(\S+)"  # Uptime
-    )
-
     for line in output.splitlines():
-        line = line.strip()
-        match = peer_pattern.match(line)
-        if match:
-            peer_ip = match.group(1)
-            state = match.group(2)
-            learn_type = match.group(3)
-            uptime = match.group(4)
-
-            is_up = state.lower() == "up"
-
-            peers.append(
-                NVEPeer(
-                    peer_ip=peer_ip,
-                    state=state,
-                    learn_type=learn_type,
-                    uptime=uptime,
-                    is_up=is_up,
-                )
-            )
+        if "nve" not in line:
+            continue
+
+        parts = line.split()
+        if len(parts) < 5 or not parts[0].startswith("nve") or not parts[0][3:].isdigit():
+            continue
+
+        peer_ip = parts[1]
+        if not _looks_like_ipv4(peer_ip):
+            continue
+
+        # State and learn type come from a tiny set of values; intern them so
+        # retained results share one string per value
+        state = sys.intern(parts[2])
+        learn_type = sys.intern(parts[3])
+        uptime = parts[4]
+
+        is_up = state.lower() == "up"
+        if is_up:
+            up_count += 1
+
+        peers.append(
+            {
+                "peer_ip": peer_ip,
+                "state": state,
+                "learn_type": learn_type,
+                "uptime": uptime,
+                "is_up": is_up,
+            }
+        )
 
-    up_count = len([p for p in peers if p.is_up])
     down_count = len(peers) - up_count
 
-    return NVEPeersResult(
-        switch=switch_name,
-        peers=peers,
-        total_count=len(peers),
-        up_count=up_count,
-        down_count=down_count,
-        raw_output=output,
+    return NVEPeersResult.model_validate(
+        {
+            "switch": switch_name,
+            "peers": peers,
+            "total_count": len(peers),
+            "up_count": up_count,
+            "down_count": down_count,
+            "raw_output": output if include_raw else None,
+        }
     )
 
 
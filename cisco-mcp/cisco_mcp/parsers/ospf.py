@@ -1,12 +1,25 @@
 """Parser for OSPF command output."""
 
 import re
-from typing import Optional
 
-from cisco_mcp.models import OSPFNeighbor, OSPFNeighborsResult
+from cisco_mcp.models import OSPFNeighborsResult
 
+# Pattern to match neighbor lines
+# Neighbor ID     Pri State            Up Time  Address         Interface
+_NEIGHBOR_RE = re.compile(
+    r"^[ \t]*(\d+\.\d+\.\d+\.\d+)[ \t]+"  # Neighbor ID
+    r"(\d+)[ \t]+"  # Priority
+    r"(\S+)[ \t]+"  # State (e.g., FULL/DR, EXSTART/-)
+    r"(\S+)[ \t]+"  # Up Time / Dead Time
+    r"(\d+\.\d+\.\d+\.\d+)[ \t]+"  # Address
+    r"(\S+)",  # Interface
+    re.MULTILINE | re.ASCII,
+)
 
-def parse_ospf_neighbors(output: str, switch_name: str) -> OSPFNeighborsResult:
+
+def parse_ospf_neighbors(
+    output: str, switch_name: str, include_raw: bool = False
+) -> OSPFNeighborsResult:
     """Parse 'show ip ospf neighbors' output.
 
     Example output format:
@@ -19,60 +32,60 @@ def parse_ospf_neighbors(output: str, switch_name: str) -> OSPFNeighborsResult:
     Args:
         output: Raw command output.
         switch_name: Name of the switch for result labeling.
+        include_raw: Keep the raw output on the result (off by default to
+            avoid holding a second copy of large outputs).
 
     Returns:
         Parsed OSPF neighbors result.
     """
-    neighbors: list[OSPFNeighbor] = []
-
-    # Pattern to match neighbor lines
-    # Neighbor ID     Pri State            Up Time  Address         Interface
-    neighbor_pattern = re.compile(
-        r"(\d+\.\d+\.\d+\.\d+)\s+"  # Neighbor ID
-        r"(\d+)\s+"  # Priority
-        r"(\S+)\s+"  # State (e.g., FULL/DR, EXSTART/-)
-        r"(\S+)\s+"  # Up Time / Dead Time
-        r"(\d+\.\d+\.\d+\.\d+)\s+"  # Address
-        r"(\S+)"  # Interface
-    )
+    # Neighbor rows only follow the table header; without it there is
+    # nothing to scan
+    if "Neighbor ID" not in output:
+        return OSPFNeighborsResult(
+            switch=switch_name,
+            neighbors=[],
+            total_count=0,
+            full_count=0,
+            problem_count=0,
+            raw_output=output if include_raw else None,
+        )
+
+    # Rows are collected as plain dicts and validated in one pass at the end
+    neighbors: list[dict] = []
+    full_count = 0
+
+    for match in _NEIGHBOR_RE.finditer(output):
+        neighbor_id, priority, state_full, dead_time, address, interface = match.groups()
+
+        # Extract base state (before /)
+        state = state_full.partition("/")[0]
+        is_healthy = state.upper() == "FULL"
+        if is_healthy:
+            full_count += 1
+
+        neighbors.append(
+            {
+                "neighbor_id": neighbor_id,
+                "priority": int(priority),
+                "state": state_full,
+                "dead_time": dead_time,
+                "address": address,
+                "interface": interface,
+                "is_healthy": is_healthy,
+            }
+        )
 
-    for line in output.splitlines():
-        line = line.strip()
-        match = neighbor_pattern.match(line)
-        if match:
-            neighbor_id = match.group(1)
-            priority = int(match.group(2))
-            state_full = match.group(3)
-            dead_time = match.group(4)
-            address = match.group(5)
-            interface = match.group(6)
-
-            # Extract base state (before /)
-            state = state_full.split("/")[0] if "/" in state_full else state_full
-            is_healthy = state.upper() == "FULL"
-
-            neighbors.append(
-                OSPFNeighbor(
-                    neighbor_id=neighbor_id,
-                    priority=priority,
-                    state=state_full,
-                    dead_time=dead_time,
-                    address=address,
-                    interface=interface,
-                    is_healthy=is_healthy,
-                )
-            )
-
-    full_count = len([n for n in neighbors if n.is_healthy])
     problem_count = len(neighbors) - full_count
 
-    return OSPFNeighborsResult(
-        switch=switch_name,
-        neighbors=neighbors,
-        total_count=len(neighbors),
-        full_count=full_count,
-        problem_count=problem_count,
-        raw_output=output,
+    return OSPFNeighborsResult.model_validate(
+        {
+            "switch": switch_name,
+            "neighbors": neighbors,
+            "total_count": len(neighbors),
+            "full_count": full_count,
+            "problem_count": problem_count,
+            "raw_output": output if include_raw else None,
+        }
     )
 
 
@@ -85,6 +98,10 @@ def get_ospf_issues(result: OSPFNeighborsResult) -> list[str]:
     Returns:
         List of issue descriptions.
     """
+    # Every neighbor is FULL; nothing to report
+    if result.problem_count == 0 and result.total_count > 0:
+        return []
+
     issues = []
 
     for neighbor in result.neighbors:
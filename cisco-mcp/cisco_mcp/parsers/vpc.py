@@ -1,11 +1,53 @@
 """Parser for vPC command output."""
 
 import re
+from collections.abc import Callable
+from typing import Optional
 
 from cisco_mcp.models import VPCStatus
 
+# "Key : Value" summary lines, matched in a single pass over the output
+_FIELD_RE = re.compile(
+    r"^[ \t]*(vPC domain id|vPC role|Peer status|vPC keep-alive status"
+    r"|Number of vPCs configured)[ \t]*:[ \t]*(\S[^\r\n]*?)[ \t\r]*$",
+    re.MULTILINE | re.ASCII,
+)
 
-def parse_vpc_brief(output: str, switch_name: str) -> VPCStatus:
+# Leading digits of a numeric summary value, e.g. "5" in "5abc"
+_LEADING_INT_RE = re.compile(r"\d+", re.ASCII)
+
+
+def _leading_int(value: str) -> Optional[int]:
+    """Return the integer value starts with, or None if it has no leading digits."""
+    match = _LEADING_INT_RE.match(value)
+    return int(match.group()) if match else None
+
+
+def _first_token(value: str) -> str:
+    """Return the first whitespace-separated token of value."""
+    return value.split(None, 1)[0]
+
+
+# Summary key -> (VPCStatus field, converter); converters return None to
+# leave the field at its default
+_FIELD_HANDLERS: dict[str, tuple[str, Callable[[str], object]]] = {
+    "vPC domain id": ("domain_id", _leading_int),
+    "vPC role": ("role", _first_token),
+    "Peer status": ("peer_status", str),
+    "vPC keep-alive status": ("peer_keepalive_status", str),
+    "Number of vPCs configured": ("vpc_count", _leading_int),
+}
+
+# Heading of the first table after the "Key : Value" summary
+_PEERLINK_HEADING = "vPC Peer-link status"
+
+# Peer-link row in the status table, e.g. "Po500  up"
+_PEERLINK_RE = re.compile(r"Po\d+\s+(up|down)", re.IGNORECASE | re.ASCII)
+
+
+def parse_vpc_brief(
+    output: str, switch_name: str, include_raw: bool = False
+) -> VPCStatus:
     """Parse 'show vpc brief' output.
 
     Example output format:
@@ -36,55 +78,69 @@ def parse_vpc_brief(output: str, switch_name: str) -> VPCStatus:
     Args:
         output: Raw command output.
         switch_name: Name of the switch for result labeling.
+        include_raw: Keep the raw output on the result (off by default to
+            avoid holding a second copy of large outputs).
 
     Returns:
         Parsed vPC status.
     """
-    # Default values
-    domain_id = 0
-    role = "unknown"
-    peer_status = "unknown"
-    peer_keepalive_status = "unknown"
-    peer_link_status = "unknown"
-    vpc_count = 0
-
-    # Parse domain ID
-    domain_match = re.search(r"vPC domain id\s*:\s*(\d+)", output)
-    if domain_match:
-        domain_id = int(domain_match.group(1))
-
-    # Parse role
-    role_match = re.search(r"vPC role\s*:\s*(\S+)", output)
-    if role_match:
-        role = role_match.group(1)
-
-    # Parse peer status
-    peer_match = re.search(r"Peer status\s*:\s*(.+?)(?:\n|$)", output)
-    if peer_match:
-        peer_status = peer_match.group(1).strip()
-
-    # Parse keepalive status
-    keepalive_match = re.search(r"vPC keep-alive status\s*:\s*(.+?)(?:\n|$)", output)
-    if keepalive_match:
-        peer_keepalive_status = keepalive_match.group(1).strip()
-
-    # Parse number of vPCs
-    vpc_count_match = re.search(r"Number of vPCs configured\s*:\s*(\d+)", output)
-    if vpc_count_match:
-        vpc_count = int(vpc_count_match.group(1))
+    # Empty or error output ("% Invalid command") has no vPC summary; skip
+    # the scans and report the defaults
+    if "vPC domain id" not in output:
+        return VPCStatus(
+            switch=switch_name,
+            domain_id=0,
+            role="unknown",
+            peer_status="unknown",
+            peer_keepalive_status="unknown",
+            peer_link_status="unknown",
+            vpc_count=0,
+            is_healthy=False,
+            raw_output=output if include_raw else None,
+        )
+
+    fields: dict[str, object] = {
+        "domain_id": 0,
+        "role": "unknown",
+        "peer_status": "unknown",
+        "peer_keepalive_status": "unknown",
+        "vpc_count": 0,
+    }
+
+    # The summary block precedes the peer-link and vPC tables, whose VLAN
+    # lists make up most of a large output; only scan up to the first table
+    summary_end = output.find(_PEERLINK_HEADING)
+    if summary_end == -1:
+        summary_end = len(output)
+
+    # The first occurrence of each key wins
+    seen: set[str] = set()
+    for match in _FIELD_RE.finditer(output, 0, summary_end):
+        key = match.group(1)
+        if key in seen:
+            continue
+        seen.add(key)
+        name, convert = _FIELD_HANDLERS[key]
+        value = convert(match.group(2))
+        if value is not None:
+            fields[name] = value
+
+    peer_status = fields["peer_status"]
+    peer_keepalive_status = fields["peer_keepalive_status"]
 
     # Parse peer-link status from the table
     # Look for "Po500  up" or similar
-    peerlink_match = re.search(r"Po\d+\s+(up|down)", output, re.IGNORECASE)
+    peerlink_match = _PEERLINK_RE.search(output)
     if peerlink_match:
         peer_link_status = peerlink_match.group(1).lower()
     else:
         peer_link_status = "unknown"
 
     # Determine overall health
+    peer_status_l = peer_status.lower()
     is_healthy = (
-        "ok" in peer_status.lower()
-        or "formed" in peer_status.lower()
+        "ok" in peer_status_l
+        or "formed" in peer_status_l
     ) and (
         "alive" in peer_keepalive_status.lower()
     ) and (
@@ -93,14 +149,14 @@ def parse_vpc_brief(output: str, switch_name: str) -> VPCStatus:
 
     return VPCStatus(
         switch=switch_name,
-        domain_id=domain_id,
-        role=role,
+        domain_id=fields["domain_id"],
+        role=fields["role"],
         peer_status=peer_status,
         peer_keepalive_status=peer_keepalive_status,
         peer_link_status=peer_link_status,
-        vpc_count=vpc_count,
+        vpc_count=fields["vpc_count"],
         is_healthy=is_healthy,
-        raw_output=output,
+        raw_output=output if include_raw else None,
     )
 
 
@@ -113,9 +169,14 @@ def get_vpc_issues(result: VPCStatus) -> list[str]:
     Returns:
         List of issue descriptions.
     """
+    # A healthy result already passed every check below
+    if result.is_healthy:
+        return []
+
     issues = []
 
-    if "ok" not in result.peer_status.lower() and "formed" not in result.peer_status.lower():
+    peer_status_l = result.peer_status.lower()
+    if "ok" not in peer_status_l and "formed" not in peer_status_l:
         issues.append(
             f"{result.switch}: vPC peer status is '{result.peer_status}' (not OK)"
         )
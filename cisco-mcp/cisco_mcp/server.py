@@ -5,13 +5,17 @@ Cisco switches in the TIG VXLAN/EVPN fabric via MCP.
 """
 
 import asyncio
+import hashlib
 import logging
 import os
-from collections.abc import AsyncIterator
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.fastmcp.prompts import base
@@ -41,6 +45,7 @@ from cisco_mcp.parsers import (
 )
 from cisco_mcp.ssh_client import (
     CommandExecutionError,
+    DEFAULT_MAX_CONCURRENT,
     InvalidCommandError,
     SSHConnectionError,
     SSHConnectionPool,
@@ -50,6 +55,142 @@ from cisco_mcp.ssh_client import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns for parsing 'show version' output (NX-OS output is plain ASCII)
+_UPTIME_RE = re.compile(r"uptime is (.+?)(?:\n|$)", re.ASCII)
+_NXOS_VER_RE = re.compile(r"NXOS:\s*version\s+(\S+)", re.ASCII)
+_SYS_VER_RE = re.compile(r"system:\s*version\s+(\S+)", re.ASCII)
+_MODEL_NEXUS_RE = re.compile(r"cisco Nexus\d+\s+(\S+)", re.IGNORECASE | re.ASCII)
+_MODEL_HW_RE = re.compile(r"Hardware\s+cisco\s+(\S+)", re.ASCII)
+
+
+def _env_max_concurrent() -> int:
+    """Read CISCO_MCP_MAX_CONCURRENCY, falling back to the pool default."""
+    value = os.getenv("CISCO_MCP_MAX_CONCURRENCY")
+    if value is None:
+        return DEFAULT_MAX_CONCURRENT
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning(
+            f"Ignoring invalid CISCO_MCP_MAX_CONCURRENCY={value!r}, "
+            f"using {DEFAULT_MAX_CONCURRENT}"
+        )
+        return DEFAULT_MAX_CONCURRENT
+    return limit
+
+
+# Upper bound on concurrent SSH commands across all tools (enforced by the pool)
+MAX_CONCURRENT = _env_max_concurrent()
+
+# LRU of parsed verify_* results keyed on (hostname, command, include_raw,
+# output digest). Polling a switch whose output has not changed skips the parse.
+_PARSE_CACHE_SIZE = 256
+_PARSE_CACHE: OrderedDict[tuple[str, str, bool, bytes], Any] = OrderedDict()
+# Guards _PARSE_CACHE, which is also used from worker threads
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# network.MD contents cached with the mtime they were read at
+_DOC_PATH = Path(__file__).parent.parent / "network.MD"
+_doc_cache: Optional[tuple[float, str]] = None
+
+# Static resource bodies for network://topology and network://ip-scheme
+_TOPOLOGY_TEXT = """# TIG Network Topology
+
+## Architecture
+Two-tier VXLAN/EVPN fabric with BGP EVPN control plane and OSPF underlay.
+
+## Spine Layer (Route Reflectors)
+```
+        SS1-TIG-6A21 (192.168.0.1)     SS2-TIG-6A21 (192.168.0.2)
+             |   |   |   |   |             |   |   |   |   |
+             +---+---+---+---+-------------+---+---+---+---+
+                         400G Links (2x per leaf)
+```
+
+## Leaf Layer (VTEPs)
+```
+Rack 6A4: LS1a-6A4 <--vPC--> LS1b-6A4  (vPC Domain 1)
+Rack 6A5: LS1a-6A5 <--vPC--> LS1b-6A5  (vPC Domain 2)
+Rack 6A6: LS1a-6A6 <--vPC--> LS1b-6A6  (vPC Domain 3)
+Rack 6A7: LS1a-6A7 <--vPC--> LS1b-6A7  (vPC Domain 5)
+Rack 6A8: BL1a-6A8 <--vPC--> BL1b-6A8  (vPC Domain 6, Border)
+          LS3a-6A8, LS4a-6A8           (Additional leafs)
+```
+
+## Key Features
+- VXLAN encapsulation with ingress replication
+- BGP EVPN control plane (AS 64996)
+- OSPF underlay (Area 0)
+- vPC dual-homing for all servers
+- PFC/ECN for RoCE traffic
+- MTU 9216 throughout
+"""
+
+_IP_SCHEME_TEXT = """# TIG Network IP Addressing Scheme
+
+## Loopback Addressing
+
+### Loopback0 (Router ID)
+- Range: 192.168.0.0/24
+- Spines: 192.168.0.1-2
+- Leafs: 192.168.0.3-12
+
+### Loopback1 (VTEP Source)
+- Range: 192.168.1.0/24
+- Primary VTEP IPs and vPC anycast VTEPs
+
+## Management Network
+- Range: 10.253.16.0/24
+- Spines: 10.253.16.10-11
+- Leafs: 10.253.16.12-21, 28-29
+
+## Fabric Links
+- Range: 192.168.3.0/24, 192.168.4.0/24
+- Point-to-point /31 subnets
+
+## VRFs
+- tig-base: L3 VNI 50000
+- tig-restricted: L3 VNI 50001
+"""
+
+
+def _parse_cached(
+    parser: Callable[..., Any],
+    hostname: str,
+    command: str,
+    output: str,
+    include_raw: bool,
+) -> Any:
+    """Parse command output, reusing the previous result for identical output.
+
+    Args:
+        parser: Parser function taking (output, switch_name, include_raw=...).
+        hostname: Switch hostname used to label the result.
+        command: Command that produced the output.
+        output: Raw command output.
+        include_raw: Passed through to the parser.
+
+    Returns:
+        The parsed result.
+    """
+    digest = hashlib.blake2b(output.encode(), digest_size=16).digest()
+    key = (hostname, command, include_raw, digest)
+
+    with _PARSE_CACHE_LOCK:
+        result = _PARSE_CACHE.get(key)
+        if result is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return result
+
+    result = parser(output, hostname, include_raw=include_raw)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = result
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return result
+
 
 @dataclass
 class AppContext:
@@ -74,7 +215,7 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     logger.info(f"Loaded {len(inventory.switches)} switches from inventory")
 
     # Initialize SSH connection pool
-    ssh_pool = SSHConnectionPool()
+    ssh_pool = SSHConnectionPool(max_concurrent=MAX_CONCURRENT)
 
     try:
         yield AppContext(inventory=inventory, ssh_pool=ssh_pool)
@@ -110,6 +251,60 @@ Switch categories:
 )
 
 
+def _select_switches(
+    inventory: SwitchInventoryManager, category: str
+) -> Sequence[Switch]:
+    """Get the switches in a category.
+
+    Args:
+        inventory: Inventory to select from.
+        category: 'all', 'spines', 'leafs', 'border', or a rack like '6A8'.
+            Unknown categories select all switches.
+    """
+    category_lower = category.lower()
+    if category_lower == "all":
+        return inventory.switches
+    elif category_lower == "spines":
+        return inventory.get_spines()
+    elif category_lower == "leafs":
+        return inventory.get_leafs()
+    elif category_lower == "border":
+        return inventory.get_border_leafs()
+    elif category_lower.startswith("6a"):
+        return inventory.get_switches_by_rack(category)
+    return inventory.switches
+
+
+async def _verify_ospf_switch(
+    ssh_pool: SSHConnectionPool, switch: Switch, include_raw: bool
+) -> OSPFNeighborsResult:
+    """Run and parse 'show ip ospf neighbors' on one switch.
+
+    The output is parsed in a worker thread so parsing overlaps with other
+    in-flight SSH reads.
+
+    Args:
+        ssh_pool: Pool to run the command through.
+        switch: Switch to query.
+        include_raw: Include the raw command output in the result.
+    """
+    command = "show ip ospf neighbors"
+    try:
+        output = await ssh_pool.execute_command(switch.ip, command)
+    except (SSHConnectionError, CommandExecutionError) as e:
+        return OSPFNeighborsResult(
+            switch=switch.hostname,
+            neighbors=[],
+            total_count=0,
+            full_count=0,
+            problem_count=0,
+            raw_output=f"Error: {e}",
+        )
+    return await asyncio.to_thread(
+        _parse_cached, parse_ospf_neighbors, switch.hostname, command, output, include_raw
+    )
+
+
 # ============================================================================
 # TOOLS
 # ============================================================================
@@ -193,21 +388,7 @@ async def run_command_all(
     inventory = app.inventory
     ssh_pool = app.ssh_pool
 
-    # Get switches based on category
-    category_lower = category.lower()
-    if category_lower == "all":
-        switches = inventory.switches
-    elif category_lower == "spines":
-        switches = inventory.get_spines()
-    elif category_lower == "leafs":
-        switches = inventory.get_leafs()
-    elif category_lower == "border":
-        switches = inventory.get_border_leafs()
-    elif category_lower.startswith("6a"):
-        switches = inventory.get_switches_by_rack(category)
-    else:
-        switches = inventory.switches
-
+    switches = _select_switches(inventory, category)
     if not switches:
         return MultiSwitchCommandResult(
             command=command,
@@ -225,7 +406,7 @@ async def run_command_all(
         hostnames=[s.hostname for s in switches],
     )
 
-    success_count = len([r for r in results if r.success])
+    success_count = sum(1 for r in results if r.success)
     failure_count = len(results) - success_count
 
     return MultiSwitchCommandResult(
@@ -275,15 +456,13 @@ async def get_switch_status(
         )
 
         # Parse version output
-        import re
-
-        uptime_match = re.search(r"uptime is (.+?)(?:\n|$)", version_output)
-        version_match = re.search(r"NXOS:\s*version\s+(\S+)", version_output)
+        uptime_match = _UPTIME_RE.search(version_output)
+        version_match = _NXOS_VER_RE.search(version_output)
         if not version_match:
-            version_match = re.search(r"system:\s*version\s+(\S+)", version_output)
-        model_match = re.search(r"cisco Nexus\d+\s+(\S+)", version_output, re.IGNORECASE)
+            version_match = _SYS_VER_RE.search(version_output)
+        model_match = _MODEL_NEXUS_RE.search(version_output)
         if not model_match:
-            model_match = re.search(r"Hardware\s+cisco\s+(\S+)", version_output)
+            model_match = _MODEL_HW_RE.search(version_output)
 
         return SwitchStatus(
             switch=switch.hostname,
@@ -312,7 +491,8 @@ async def get_switch_status(
 @mcp.tool()
 async def verify_ospf_neighbors(
     switch_name: str,
-    ctx: Context[ServerSession, AppContext],
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
 ) -> OSPFNeighborsResult:
     """Verify OSPF neighbor adjacencies on a switch.
 
@@ -320,6 +500,7 @@ async def verify_ospf_neighbors(
 
     Args:
         switch_name: Switch hostname or short name
+        include_raw: Include the raw command output in the result
 
     Returns:
         OSPF neighbors with health status.
@@ -339,25 +520,50 @@ async def verify_ospf_neighbors(
             raw_output=f"Switch '{switch_name}' not found",
         )
 
-    try:
-        await ctx.info(f"Verifying OSPF neighbors on {switch.hostname}")
-        output = await ssh_pool.execute_command(switch.ip, "show ip ospf neighbors")
-        return parse_ospf_neighbors(output, switch.hostname)
-    except (SSHConnectionError, CommandExecutionError) as e:
-        return OSPFNeighborsResult(
-            switch=switch.hostname,
-            neighbors=[],
-            total_count=0,
-            full_count=0,
-            problem_count=0,
-            raw_output=f"Error: {e}",
+    await ctx.info(f"Verifying OSPF neighbors on {switch.hostname}")
+    return await _verify_ospf_switch(ssh_pool, switch, include_raw)
+
+
+@mcp.tool()
+async def verify_ospf_neighbors_all(
+    category: str = "all",
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
+) -> list[OSPFNeighborsResult]:
+    """Verify OSPF neighbor adjacencies on multiple switches.
+
+    Commands run concurrently and each output is parsed in a worker thread,
+    so parsing overlaps with the remaining SSH reads.
+
+    Args:
+        category: Switch category - 'all', 'spines', 'leafs', 'border', or a rack like '6A8'
+        include_raw: Include the raw command output in each result
+
+    Returns:
+        OSPF neighbors with health status, one result per switch.
+    """
+    app = ctx.request_context.lifespan_context
+    inventory = app.inventory
+    ssh_pool = app.ssh_pool
+
+    switches = _select_switches(inventory, category)
+    if not switches:
+        return []
+
+    await ctx.info(f"Verifying OSPF neighbors on {len(switches)} switches...")
+
+    return list(
+        await asyncio.gather(
+            *(_verify_ospf_switch(ssh_pool, s, include_raw) for s in switches)
         )
+    )
 
 
 @mcp.tool()
 async def verify_bgp_evpn(
     switch_name: str,
-    ctx: Context[ServerSession, AppContext],
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
 ) -> BGPEVPNResult:
     """Verify BGP EVPN sessions on a switch.
 
@@ -365,6 +571,7 @@ async def verify_bgp_evpn(
 
     Args:
         switch_name: Switch hostname or short name
+        include_raw: Include the raw command output in the result
 
     Returns:
         BGP EVPN session status.
@@ -387,8 +594,9 @@ async def verify_bgp_evpn(
 
     try:
         await ctx.info(f"Verifying BGP EVPN on {switch.hostname}")
-        output = await ssh_pool.execute_command(switch.ip, "show bgp l2vpn evpn summary")
-        return parse_bgp_evpn_summary(output, switch.hostname)
+        command = "show bgp l2vpn evpn summary"
+        output = await ssh_pool.execute_command(switch.ip, command)
+        return _parse_cached(parse_bgp_evpn_summary, switch.hostname, command, output, include_raw)
     except (SSHConnectionError, CommandExecutionError) as e:
         return BGPEVPNResult(
             switch=switch.hostname,
@@ -404,7 +612,8 @@ async def verify_bgp_evpn(
 @mcp.tool()
 async def verify_vpc_status(
     switch_name: str,
-    ctx: Context[ServerSession, AppContext],
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
 ) -> VPCStatus:
     """Verify vPC domain status on a switch.
 
@@ -412,6 +621,7 @@ async def verify_vpc_status(
 
     Args:
         switch_name: Switch hostname or short name
+        include_raw: Include the raw command output in the result
 
     Returns:
         vPC domain status.
@@ -436,8 +646,9 @@ async def verify_vpc_status(
 
     try:
         await ctx.info(f"Verifying vPC status on {switch.hostname}")
-        output = await ssh_pool.execute_command(switch.ip, "show vpc brief")
-        return parse_vpc_brief(output, switch.hostname)
+        command = "show vpc brief"
+        output = await ssh_pool.execute_command(switch.ip, command)
+        return _parse_cached(parse_vpc_brief, switch.hostname, command, output, include_raw)
     except (SSHConnectionError, CommandExecutionError) as e:
         return VPCStatus(
             switch=switch.hostname,
@@ -455,7 +666,8 @@ async def verify_vpc_status(
 @mcp.tool()
 async def verify_nve_peers(
     switch_name: str,
-    ctx: Context[ServerSession, AppContext],
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
 ) -> NVEPeersResult:
     """Verify NVE (VXLAN) peers on a switch.
 
@@ -463,6 +675,7 @@ async def verify_nve_peers(
 
     Args:
         switch_name: Switch hostname or short name
+        include_raw: Include the raw command output in the result
 
     Returns:
         NVE peer status.
@@ -484,8 +697,9 @@ async def verify_nve_peers(
 
     try:
         await ctx.info(f"Verifying NVE peers on {switch.hostname}")
-        output = await ssh_pool.execute_command(switch.ip, "show nve peers")
-        return parse_nve_peers(output, switch.hostname)
+        command = "show nve peers"
+        output = await ssh_pool.execute_command(switch.ip, command)
+        return _parse_cached(parse_nve_peers, switch.hostname, command, output, include_raw)
     except (SSHConnectionError, CommandExecutionError) as e:
         return NVEPeersResult(
             switch=switch.hostname,
@@ -500,12 +714,14 @@ async def verify_nve_peers(
 @mcp.tool()
 async def check_interface_errors(
     switch_name: str,
-    ctx: Context[ServerSession, AppContext],
+    include_raw: bool = False,
+    ctx: Context[ServerSession, AppContext] = None,
 ) -> InterfaceErrorsResult:
     """Check interface error counters on a switch.
 
     Args:
         switch_name: Switch hostname or short name
+        include_raw: Include the raw command output in the result
 
     Returns:
         Interface error counters.
@@ -525,8 +741,11 @@ async def check_interface_errors(
 
     try:
         await ctx.info(f"Checking interface errors on {switch.hostname}")
-        output = await ssh_pool.execute_command(switch.ip, "show interface counters errors")
-        return parse_interface_counters(output, switch.hostname)
+        command = "show interface counters errors"
+        output = await ssh_pool.execute_command(switch.ip, command)
+        return _parse_cached(
+            parse_interface_counters, switch.hostname, command, output, include_raw
+        )
     except (SSHConnectionError, CommandExecutionError) as e:
         return InterfaceErrorsResult(
             switch=switch.hostname,
@@ -610,23 +829,7 @@ async def list_switches(
 @mcp.resource("switch://inventory")
 def get_switch_inventory() -> str:
     """Get the complete switch inventory."""
-    inventory = get_inventory()
-    inv = inventory.get_inventory()
-
-    lines = ["# TIG Network Switch Inventory\n"]
-    lines.append(f"Total Switches: {inv.total_count}")
-    lines.append(f"- Spines: {inv.spine_count}")
-    lines.append(f"- Leafs: {inv.leaf_count}")
-    lines.append(f"- Border Leafs: {inv.border_count}\n")
-
-    lines.append("## Switches\n")
-    lines.append("| Hostname | IP | Role | Rack |")
-    lines.append("|----------|-------|------|------|")
-
-    for switch in inv.switches:
-        lines.append(f"| {switch.hostname} | {switch.ip} | {switch.role.value} | {switch.rack} |")
-
-    return "\n".join(lines)
+    return get_inventory().get_inventory_markdown()
 
 
 @mcp.resource("switch://{name}/info")
@@ -655,77 +858,28 @@ ssh -i ~/.ssh/cisco-key cisco-mcp@{switch.ip}
 @mcp.resource("network://topology")
 def get_network_topology() -> str:
     """Get the network topology diagram."""
-    return """# TIG Network Topology
-
-## Architecture
-Two-tier VXLAN/EVPN fabric with BGP EVPN control plane and OSPF underlay.
-
-## Spine Layer (Route Reflectors)
-```
-        SS1-TIG-6A21 (192.168.0.1)     SS2-TIG-6A21 (192.168.0.2)
-             |   |   |   |   |             |   |   |   |   |
-             +---+---+---+---+-------------+---+---+---+---+
-                         400G Links (2x per leaf)
-```
-
-## Leaf Layer (VTEPs)
-```
-Rack 6A4: LS1a-6A4 <--vPC--> LS1b-6A4  (vPC Domain 1)
-Rack 6A5: LS1a-6A5 <--vPC--> LS1b-6A5  (vPC Domain 2)
-Rack 6A6: LS1a-6A6 <--vPC--> LS1b-6A6  (vPC Domain 3)
-Rack 6A7: LS1a-6A7 <--vPC--> LS1b-6A7  (vPC Domain 5)
-Rack 6A8: BL1a-6A8 <--vPC--> BL1b-6A8  (vPC Domain 6, Border)
-          LS3a-6A8, LS4a-6A8           (Additional leafs)
-```
-
-## Key Features
-- VXLAN encapsulation with ingress replication
-- BGP EVPN control plane (AS 64996)
-- OSPF underlay (Area 0)
-- vPC dual-homing for all servers
-- PFC/ECN for RoCE traffic
-- MTU 9216 throughout
-"""
+    return _TOPOLOGY_TEXT
 
 
 @mcp.resource("network://documentation")
 def get_network_documentation() -> str:
     """Get the network documentation from network.MD."""
-    doc_path = Path(__file__).parent.parent / "network.MD"
-    if doc_path.exists():
-        return doc_path.read_text()
-    return "Network documentation not found at network.MD"
+    global _doc_cache
+    try:
+        mtime = _DOC_PATH.stat().st_mtime
+    except OSError:
+        return "Network documentation not found at network.MD"
+
+    # Re-read only when the file has changed since the last fetch
+    if _doc_cache is None or _doc_cache[0] != mtime:
+        _doc_cache = (mtime, _DOC_PATH.read_text())
+    return _doc_cache[1]
 
 
 @mcp.resource("network://ip-scheme")
 def get_ip_scheme() -> str:
     """Get the IP addressing scheme."""
-    return """# TIG Network IP Addressing Scheme
-
-## Loopback Addressing
-
-### Loopback0 (Router ID)
-- Range: 192.168.0.0/24
-- Spines: 192.168.0.1-2
-- Leafs: 192.168.0.3-12
-
-### Loopback1 (VTEP Source)
-- Range: 192.168.1.0/24
-- Primary VTEP IPs and vPC anycast VTEPs
-
-## Management Network
-- Range: 10.253.16.0/24
-- Spines: 10.253.16.10-11
-- Leafs: 10.253.16.12-21, 28-29
-
-## Fabric Links
-- Range: 192.168.3.0/24, 192.168.4.0/24
-- Point-to-point /31 subnets
-
-## VRFs
-- tig-base: L3 VNI 50000
-- tig-restricted: L3 VNI 50001
-"""
+    return _IP_SCHEME_TEXT
 
 
 # ============================================================================
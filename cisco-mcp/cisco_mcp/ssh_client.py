@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,24 @@ DEFAULT_SSH_KEY = os.path.expanduser("~/.ssh/cisco-key")
 DEFAULT_USERNAME = "cisco-mcp"
 DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_COMMAND_TIMEOUT = 60  # seconds for long commands
+DEFAULT_KEEPALIVE_INTERVAL = 15  # seconds between SSH keepalive probes
+DEFAULT_KEEPALIVE_COUNT_MAX = 3  # unanswered probes before disconnecting
+DEFAULT_REAP_INTERVAL = 30  # seconds between sweeps for dead pooled connections
+DEFAULT_MAX_CONCURRENT = 64  # in-flight operations per connection pool
+DEFAULT_OUTPUT_TTL = 0.0  # seconds a command's output is reused; 0 runs it live
+DEFAULT_OUTPUT_CACHE_SIZE = 2048
+
+# Output TTLs (seconds) for the fixed show commands behind the status and
+# verify tools, matched on the exact command string. Every other command,
+# including free-form run_command input and interface error counters, runs
+# live unless the pool's output_ttl says otherwise.
+OUTPUT_TTL_OVERRIDES = {
+    "show version": 60.0,
+    "show ip ospf neighbors": 30.0,
+    "show bgp l2vpn evpn summary": 30.0,
+    "show vpc brief": 30.0,
+    "show nve peers": 30.0,
+}
 
 
 class SSHConnectionError(Exception):
@@ -62,6 +81,41 @@ BLOCKED_COMMAND_PATTERNS = [
     r"^undebug",
 ]
 
+# All blocked patterns as one alternation, so validation is a single match
+_BLOCKED_RE = re.compile("|".join(f"(?:{p})" for p in BLOCKED_COMMAND_PATTERNS))
+
+# Sensitive values to mask in command output: (pattern, replacement)
+_MASK_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r"(password\s*[=:]\s*)(\S+)", r"\1********"),
+        (r"(key\s*[=:]\s*)(\S+)", r"\1********"),
+        (r"(secret\s*[=:]\s*)(\S+)", r"\1********"),
+        (r"(md5\s+\d+\s+)(\S+)", r"\1********"),
+        (r"(community\s+)(\S+)", r"\1********"),
+    )
+]
+
+# The same patterns fused into one alternation, so masking is a single pass.
+# The keywords start with different letters, so branches never compete; the
+# leading lookahead lets the engine skip positions that cannot start one.
+_MASK_RE = re.compile(
+    r"(?=[pksmc])"
+    r"(?P<prefix>"
+    r"password\s*[=:]\s*"
+    r"|key\s*[=:]\s*"
+    r"|secret\s*[=:]\s*"
+    r"|md5\s+\d+\s+"
+    r"|community\s+"
+    r")(?P<value>\S+)",
+    re.IGNORECASE,
+)
+_MASK_KEYWORD_RE = re.compile(r"password|key|secret|md5|community", re.IGNORECASE)
+
+# Substrings every maskable output contains once case-folded. "community" is
+# cut before its "i", which re.IGNORECASE also matches as "İ" or "ı".
+_MASK_PREFILTER = ("password", "key", "secret", "md5", "commun")
+
 
 def validate_command(command: str) -> None:
     """Validate that a command is read-only.
@@ -75,17 +129,16 @@ def validate_command(command: str) -> None:
     cmd = command.strip().lower()
 
     # Check if command starts with allowed prefix
-    if not any(cmd.startswith(prefix) for prefix in ALLOWED_COMMAND_PREFIXES):
+    if not cmd.startswith(ALLOWED_COMMAND_PREFIXES):
         raise InvalidCommandError(
             f"Command '{command}' is not allowed. Only 'show' commands are permitted."
         )
 
     # Double-check against blocked patterns
-    for pattern in BLOCKED_COMMAND_PATTERNS:
-        if re.match(pattern, cmd):
-            raise InvalidCommandError(
-                f"Command '{command}' matches blocked pattern and is not allowed."
-            )
+    if _BLOCKED_RE.match(cmd):
+        raise InvalidCommandError(
+            f"Command '{command}' matches blocked pattern and is not allowed."
+        )
 
 
 def mask_sensitive_output(output: str) -> str:
@@ -97,18 +150,31 @@ def mask_sensitive_output(output: str) -> str:
     Returns:
         Output with sensitive data masked.
     """
+    # Most outputs mention none of the keywords; a few substring scans over
+    # the case-folded text are much cheaper than the regex pass. casefold()
+    # rather than lower() so it agrees with re.IGNORECASE (e.g. "ſecret").
+    folded = output.casefold()
+    if not any(keyword in folded for keyword in _MASK_PREFILTER):
+        return output
+
+    nested = False
+
+    def mask(match: re.Match) -> str:
+        nonlocal nested
+        if _MASK_KEYWORD_RE.search(match.group("value")):
+            nested = True
+        return match.group("prefix") + "********"
+
     # Mask passwords and keys
-    patterns = [
-        (r"(password\s*[=:]\s*)(\S+)", r"\1********"),
-        (r"(key\s*[=:]\s*)(\S+)", r"\1********"),
-        (r"(secret\s*[=:]\s*)(\S+)", r"\1********"),
-        (r"(md5\s+\d+\s+)(\S+)", r"\1********"),
-        (r"(community\s+)(\S+)", r"\1********"),
-    ]
+    result = _MASK_RE.sub(mask, output)
 
-    result = output
-    for pattern, replacement in patterns:
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    # A masked value that itself starts another secret (e.g. "community
+    # password= x") hides the inner match from the single pass; apply the
+    # patterns one at a time instead so nothing is left unmasked
+    if nested:
+        result = output
+        for pattern, replacement in _MASK_PATTERNS:
+            result = pattern.sub(replacement, result)
 
     return result
 
@@ -153,6 +219,10 @@ class CiscoSSHClient:
                     username=self.username,
                     client_keys=[self.key_file],
                     known_hosts=None,  # Accept any host key (lab environment)
+                    # Keep idle connections alive through firewalls and
+                    # notice dead peers before the next command
+                    keepalive_interval=DEFAULT_KEEPALIVE_INTERVAL,
+                    keepalive_count_max=DEFAULT_KEEPALIVE_COUNT_MAX,
                 ),
                 timeout=self.timeout,
             )
@@ -166,6 +236,11 @@ class CiscoSSHClient:
         except OSError as e:
             raise SSHConnectionError(f"Network error connecting to {self.host}: {e}")
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the client holds an open connection."""
+        return self._connection is not None and not self._connection.is_closed()
+
     async def disconnect(self) -> None:
         """Close SSH connection."""
         if self._connection is not None:
@@ -248,6 +323,9 @@ class SSHConnectionPool:
         username: str = DEFAULT_USERNAME,
         key_file: str = DEFAULT_SSH_KEY,
         max_connections_per_host: int = 2,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        output_ttl: float = DEFAULT_OUTPUT_TTL,
+        output_cache_size: int = DEFAULT_OUTPUT_CACHE_SIZE,
     ):
         """Initialize connection pool.
 
@@ -255,12 +333,28 @@ class SSHConnectionPool:
             username: SSH username.
             key_file: Path to SSH private key.
             max_connections_per_host: Maximum connections per switch.
+            max_concurrent: Maximum switches being queried at once across
+                all callers of the pool.
+            output_ttl: Seconds to reuse a command's output for the same
+                switch for commands not listed in OUTPUT_TTL_OVERRIDES. The
+                default 0 runs them live.
+            output_cache_size: Maximum number of cached outputs.
         """
         self.username = username
         self.key_file = key_file
         self.max_connections_per_host = max_connections_per_host
         self._connections: dict[str, CiscoSSHClient] = {}
         self._lock = asyncio.Lock()
+        self._host_locks: dict[str, asyncio.Lock] = {}
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self.reap_interval = DEFAULT_REAP_INTERVAL
+        self._reaper_task: Optional[asyncio.Task] = None
+        self.output_ttl = output_ttl
+        self.output_cache_size = output_cache_size
+        # (host, command) -> (expiry on the monotonic clock, output)
+        self._output_cache: dict[tuple[str, str], tuple[float, str]] = {}
+        # Commands currently running, so identical concurrent calls share one
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
 
     async def get_connection(self, host: str) -> CiscoSSHClient:
         """Get or create a connection to a host.
@@ -271,8 +365,17 @@ class SSHConnectionPool:
         Returns:
             Connected SSH client.
         """
-        async with self._lock:
-            if host not in self._connections:
+        self._ensure_reaper()
+
+        # Fast path: established connections need no locking
+        client = self._connections.get(host)
+        if client is not None and client.is_connected:
+            return client
+
+        # Only callers connecting to the same host wait on each other
+        async with self._host_locks.setdefault(host, asyncio.Lock()):
+            client = self._connections.get(host)
+            if client is None or not client.is_connected:
                 client = CiscoSSHClient(
                     host=host,
                     username=self.username,
@@ -281,7 +384,25 @@ class SSHConnectionPool:
                 await client.connect()
                 self._connections[host] = client
 
-            return self._connections[host]
+            return client
+
+    def _ensure_reaper(self) -> None:
+        """Start the background sweep for dead connections if not running."""
+        if self._reaper_task is None or self._reaper_task.done():
+            self._reaper_task = asyncio.create_task(self._reap_dead_connections())
+
+    async def _reap_dead_connections(self) -> None:
+        """Periodically drop pooled connections that have closed.
+
+        Keepalives close connections whose peer stopped answering; removing
+        them here means the next command reconnects instead of failing.
+        """
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            for host, client in list(self._connections.items()):
+                if not client.is_connected:
+                    logger.info(f"Dropping dead connection to {host}")
+                    del self._connections[host]
 
     async def execute_command(
         self,
@@ -297,10 +418,65 @@ class SSHConnectionPool:
             timeout: Command timeout.
 
         Returns:
-            Command output.
+            Command output. For commands with an output TTL (see
+            OUTPUT_TTL_OVERRIDES), output on the same switch is reused for
+            that TTL and concurrent identical calls share one execution.
         """
-        client = await self.get_connection(host)
-        return await client.execute_command(command, timeout)
+        ttl = self._output_ttl(command)
+        if ttl <= 0:
+            return await self._execute_uncached(host, command, timeout)
+
+        # Keyed on the exact command; whitespace can be significant, e.g.
+        # inside a quoted '| include' pattern
+        key = (host, command)
+        while True:
+            cached = self._output_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Retry only if the call we were waiting on was cancelled,
+                # not this one
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            output = await self._execute_uncached(host, command, timeout)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+
+        self._output_cache.pop(key, None)
+        self._output_cache[key] = (time.monotonic() + ttl, output)
+        if len(self._output_cache) > self.output_cache_size:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._output_cache[next(iter(self._output_cache))]
+        future.set_result(output)
+        return output
+
+    def _output_ttl(self, command: str) -> float:
+        """Get the output cache TTL for a command."""
+        return OUTPUT_TTL_OVERRIDES.get(command, self.output_ttl)
+
+    async def _execute_uncached(self, host: str, command: str, timeout: int) -> str:
+        """Execute a command on a switch, bypassing the output cache."""
+        async with self._sem:
+            client = await self.get_connection(host)
+            return await client.execute_command(command, timeout)
 
     async def execute_on_multiple(
         self,
@@ -349,10 +525,21 @@ class SSHConnectionPool:
 
     async def close_all(self) -> None:
         """Close all connections in the pool."""
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            self._reaper_task = None
+
         async with self._lock:
-            for client in self._connections.values():
-                await client.disconnect()
-            self._connections.clear()
+            # get_connection does not take self._lock, so a connect finishing
+            # during shutdown may add to the pool. Detach the current clients
+            # before awaiting any disconnect, and repeat until none are left.
+            while self._connections:
+                clients = list(self._connections.values())
+                self._connections.clear()
+                for client in clients:
+                    await client.disconnect()
+            self._host_locks.clear()
+            self._output_cache.clear()
             logger.info("All connections closed")
 
     async def __aenter__(self) -> "SSHConnectionPool":
@@ -8,11 +8,11 @@ Usage:
 
 import asyncio
 import argparse
-import json
 import logging
 from pathlib import Path
-from typing import List, Optional
-import tempfile
+from typing import List, Optional, Tuple
+
+from utils import calculate_metrics, json_dumps, run_prompt_cli, validate_skill
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
@@ -20,48 +20,46 @@ logger = logging.getLogger(__name__)
 
 class SkillVariant:
     """Single skill variant"""
+    # Runs create many variants; slots drop the per-instance __dict__
+    __slots__ = ('content', 'generation', 'variant_id', 'lineage', 'score', '_valid', '_errors')
+
     def __init__(self, content: str, generation: int, variant_id: int, lineage: List[int]):
         self.content = content
         self.generation = generation
         self.variant_id = variant_id
         self.lineage = lineage
         self.score: Optional[float] = None
+        self._valid: Optional[bool] = None
+        self._errors: List[str] = []
 
     def is_valid(self) -> bool:
-        """Check markdown validity using comprehensive utils validation"""
-        from utils import validate_skill
-        valid, errors = validate_skill(self.content)
-        if not valid:
-            logger.debug(f"Variant {self.variant_id} validation errors: {errors}")
-        return valid
+        """Check markdown validity using comprehensive utils validation (cached)"""
+        if self._valid is None:
+            self._valid, self._errors = validate_skill(self.content)
+            if not self._valid:
+                logger.debug(f"Variant {self.variant_id} validation errors: {self._errors}")
+        return self._valid
 
 
 async def call_llm(prompt: str, temperature: float = 1.0, cli: str = "claude", max_retries: int = 3) -> Optional[str]:
     """Call LLM CLI with prompt and retry logic"""
-    for attempt in range(max_retries):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(prompt)
-            prompt_file = f.name
+    if cli == "claude":
+        cmd, file_flag = ["claude", "--temperature", str(temperature)], "--file"
+    else:
+        cmd, file_flag = ["qune", "--temp", str(temperature)], "--input"
 
+    for attempt in range(max_retries):
         try:
-            cmd = ["claude", "--temperature", str(temperature), "--file", prompt_file] if cli == "claude" \
-                  else ["qune", "--temp", str(temperature), "--input", prompt_file]
-
-            proc = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-            stdout, stderr = await proc.communicate()
+            returncode, stdout = await run_prompt_cli(cmd, file_flag, prompt)
 
-            Path(prompt_file).unlink(missing_ok=True)
-            
-            if proc.returncode == 0:
+            if returncode == 0:
                 return stdout.decode('utf-8').strip()
             else:
-                logger.warning(f"LLM call attempt {attempt+1}/{max_retries} failed (rc={proc.returncode})")
+                logger.warning(f"LLM call attempt {attempt+1}/{max_retries} failed (rc={returncode})")
                 if attempt < max_retries - 1:
                     await asyncio.sleep(2 ** attempt)  # Exponential backoff
         except Exception as e:
             logger.error(f"LLM call attempt {attempt+1}/{max_retries} exception: {e}")
-            Path(prompt_file).unlink(missing_ok=True)
             if attempt < max_retries - 1:
                 await asyncio.sleep(2 ** attempt)
     
@@ -109,8 +107,14 @@ async def mutate(parent: SkillVariant, mut_type: str, config: dict, var_id: int)
     return variant if variant.is_valid() else None
 
 
-async def expand_generation(parents: List[SkillVariant], config: dict, gen: int) -> List[SkillVariant]:
-    """Expand population through mutation"""
+async def expand_generation(parents: List[SkillVariant], config: dict, gen: int,
+                            gen_dir: Optional[Path] = None) -> List[SkillVariant]:
+    """Expand population through mutation
+
+    Offspring are collected in completion order. When gen_dir is given, each
+    valid variant's skill file is written as soon as it arrives, so disk I/O
+    overlaps the LLM calls still in flight.
+    """
     logger.info(f"Gen {gen}: Expanding {len(parents)} → {len(parents)*2}")
 
     import random
@@ -123,26 +127,49 @@ async def expand_generation(parents: List[SkillVariant], config: dict, gen: int)
             tasks.append(mutate(parent, mut_type, config, var_id))
             var_id += 1
 
-    offspring = await asyncio.gather(*tasks)
-    valid = [o for o in offspring if o and o.is_valid()]
+    if gen_dir is not None:
+        gen_dir.mkdir(parents=True, exist_ok=True)
+
+    valid = []
+    for fut in asyncio.as_completed(tasks):
+        # mutate() already returns None for invalid content
+        variant = await fut
+        if not variant:
+            continue
+        if gen_dir is not None:
+            await write_files([(gen_dir / f"skill_{len(valid):03d}.md", variant.content)])
+        valid.append(variant)
+
     logger.info(f"Gen {gen}: Created {len(valid)} valid variants")
     return valid
 
 
-def save_generation(variants: List[SkillVariant], gen_dir: Path):
-    """Save generation to disk with metrics report"""
-    from utils import calculate_metrics
-    
+async def write_files(files: List[Tuple[Path, str]]):
+    """Write (path, text) pairs concurrently off the event loop thread"""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(None, path.write_text, text)
+                           for path, text in files))
+
+
+async def save_generation(variants: List[SkillVariant], gen_dir: Path, skills_written: bool = False):
+    """Save generation to disk with metrics report
+
+    Pass skills_written=True when the skill files were already streamed out
+    by expand_generation; only metadata and metrics are written then.
+    """
     gen_dir.mkdir(parents=True, exist_ok=True)
+    files = []
     for i, v in enumerate(variants):
-        (gen_dir / f"skill_{i:03d}.md").write_text(v.content)
-        (gen_dir / f"skill_{i:03d}_meta.json").write_text(
-            json.dumps({"variant_id": v.variant_id, "generation": v.generation,
-                       "lineage": v.lineage, "score": v.score}, indent=2))
+        if not skills_written:
+            files.append((gen_dir / f"skill_{i:03d}.md", v.content))
+        files.append((gen_dir / f"skill_{i:03d}_meta.json",
+                      json_dumps({"variant_id": v.variant_id, "generation": v.generation,
+                                  "lineage": v.lineage, "score": v.score})))
     
     # Save generation metrics
     metrics = calculate_metrics(variants)
-    (gen_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
+    files.append((gen_dir / "metrics.json", json_dumps(metrics)))
+    await write_files(files)
     logger.info(f"Metrics: {metrics['valid_variants']}/{metrics['total_variants']} valid, "
                 f"avg length: {metrics['avg_length']}")
 
@@ -185,13 +212,14 @@ async def run_evolution(config: dict):
         logger.error("Invalid seed")
         return
 
-    save_generation([seed], out_dir / "gen_0_seed")
+    await save_generation([seed], out_dir / "gen_0_seed")
     population = [seed]
 
     # Expansion
     for gen in range(1, config['generations'] + 1):
-        population = await expand_generation(population, config, gen)
-        save_generation(population, out_dir / f"gen_{gen}_expand")
+        gen_dir = out_dir / f"gen_{gen}_expand"
+        population = await expand_generation(population, config, gen, gen_dir)
+        await save_generation(population, gen_dir, skills_written=True)
 
         if not population:
             logger.error("Population died")
@@ -208,11 +236,12 @@ async def run_evolution(config: dict):
             logger.info(f"Selection round {round_num}: {len(population)} → {len(population)//2}")
 
             temp_dir = selection_dir / f"round_{round_num}_input"
-            save_generation(population, temp_dir)
+            await save_generation(population, temp_dir)
 
             population = await run_selection(
                 temp_dir, config['intent'], len(population)//2,
-                selection_dir / f"round_{round_num}.json")
+                selection_dir / f"round_{round_num}.json",
+                cache_file=out_dir / "judge_cache.json")
             round_num += 1
 
         # Winner
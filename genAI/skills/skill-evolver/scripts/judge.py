@@ -8,11 +8,13 @@ Usage:
 
 import asyncio
 import argparse
-import json
+import hashlib
 import logging
+import re
 from pathlib import Path
 from typing import List, Dict, Optional
-import tempfile
+
+from utils import json_dumps, json_loads, run_prompt_cli
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
@@ -37,32 +39,55 @@ Output JSON only:
 }}
 """
 
+# First fenced block holding a JSON object, with or without a "json" tag
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+
+# Judge results keyed by a hash of judge count + test case + skill content;
+# winners are re-judged every selection round with unchanged text. Kept in
+# least-recently-used order so the persisted file can be trimmed.
+_SCORE_CACHE: Dict[str, List[Dict]] = {}
+
+# Entries kept when the cache is written back to disk
+SCORE_CACHE_MAX = 4096
+
+
+def _score_key(skill: str, test_case: str, num_judges: int) -> str:
+    """Cache key for a skill evaluated against a test case by num_judges judges"""
+    data = f"{num_judges}\0{test_case}\0{skill}".encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def load_score_cache(cache_file: Path):
+    """Merge judge results persisted by a previous run into the cache"""
+    if not cache_file.exists():
+        return
+    try:
+        _SCORE_CACHE.update(json_loads(cache_file.read_bytes()))
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable judge cache {cache_file}: {e}")
+
+
+def save_score_cache(cache_file: Path):
+    """Persist the most recently used judge results so later runs can reuse them"""
+    for key in list(_SCORE_CACHE)[:-SCORE_CACHE_MAX]:
+        del _SCORE_CACHE[key]
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json_dumps(_SCORE_CACHE, indent=False))
+
 
 async def call_judge(skill: str, test_case: str) -> Optional[Dict]:
     """Single judge evaluation"""
     prompt = JUDGE_PROMPT.format(test_case=test_case, skill=skill)
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write(prompt)
-        prompt_file = f.name
-
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "claude", "--temperature", "0.3", "--file", prompt_file,
-            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
-        stdout, _ = await proc.communicate()
-        Path(prompt_file).unlink(missing_ok=True)
-
-        if proc.returncode != 0:
+        returncode, stdout = await run_prompt_cli(
+            ["claude", "--temperature", "0.3"], "--file", prompt)
+        if returncode != 0:
             return None
 
         response = stdout.decode('utf-8').strip()
-        if "```json" in response:
-            response = response.split("```json")[1].split("```")[0].strip()
-        elif "```" in response:
-            response = response.split("```")[1].split("```")[0].strip()
-
-        return json.loads(response)
+        match = _JSON_BLOCK.search(response)
+        return json_loads(match.group(1) if match else response)
     except Exception as e:
         logger.error(f"Judge call failed: {e}")
         return None
@@ -71,12 +96,19 @@ async def call_judge(skill: str, test_case: str) -> Optional[Dict]:
 async def evaluate_skill(skill_path: Path, test_case: str, num_judges: int, criteria: Dict) -> Dict:
     """Evaluate single skill with multiple judges"""
     skill = skill_path.read_text()
-    tasks = [call_judge(skill, test_case) for _ in range(num_judges)]
-    results = await asyncio.gather(*tasks)
+    key = _score_key(skill, test_case, num_judges)
+    # pop() + reinsert below keeps the dict in least-recently-used order
+    valid = _SCORE_CACHE.pop(key, None)
+
+    if valid is None:
+        tasks = [call_judge(skill, test_case) for _ in range(num_judges)]
+        results = await asyncio.gather(*tasks)
+
+        valid = [r for r in results if r]
+        if not valid:
+            return {"skill": skill_path.name, "score": 0, "feedback": ["No valid evaluations"]}
 
-    valid = [r for r in results if r]
-    if not valid:
-        return {"skill": skill_path.name, "score": 0, "feedback": ["No valid evaluations"]}
+    _SCORE_CACHE[key] = valid
 
     # Average across judges and apply weights
     avg_scores = {k: sum(r.get(k, 0) for r in valid) / len(valid)
@@ -114,15 +146,20 @@ def select_winners(results: List[Dict], keep_top: int) -> List[Dict]:
     return winners
 
 
-async def run_selection(gen_dir: Path, test_case: str, keep_top: int, output_file: Optional[Path] = None):
+async def run_selection(gen_dir: Path, test_case: str, keep_top: int, output_file: Optional[Path] = None,
+                        cache_file: Optional[Path] = None):
     """Main selection function (called from evolve_loop.py)"""
     criteria = {"correctness": 30, "clarity": 25, "usability": 25, "efficiency": 20}
+    if cache_file:
+        load_score_cache(cache_file)
     results = await evaluate_generation(gen_dir, test_case, num_judges=3, criteria=criteria)
+    if cache_file:
+        save_score_cache(cache_file)
     winners = select_winners(results, keep_top)
 
     if output_file:
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(json.dumps({"results": results, "winners": [w["skill"] for w in winners]}, indent=2))
+        output_file.write_text(json_dumps({"results": results, "winners": [w["skill"] for w in winners]}))
 
     # Load winner variants
     from evolve_loop import SkillVariant
@@ -134,7 +171,7 @@ async def run_selection(gen_dir: Path, test_case: str, keep_top: int, output_fil
 
         content = skill_path.read_text()
         if meta_path.exists():
-            meta = json.loads(meta_path.read_text())
+            meta = json_loads(meta_path.read_bytes())
             variant = SkillVariant(content, meta["generation"], meta["variant_id"], meta["lineage"])
         else:
             variant = SkillVariant(content, 0, 0, [])
@@ -154,6 +191,7 @@ def main():
     parser.add_argument("--criteria", default="correctness:30,clarity:25,usability:25,efficiency:20",
                        help="Evaluation criteria weights")
     parser.add_argument("--output-file", help="Output JSON file")
+    parser.add_argument("--cache-file", help="Judge result cache, reused across runs")
 
     args = parser.parse_args()
 
@@ -174,16 +212,21 @@ def main():
         logger.error(f"Failed to parse criteria: {e}")
         return
 
+    cache_file = Path(args.cache_file) if args.cache_file else None
+    if cache_file:
+        load_score_cache(cache_file)
     results = asyncio.run(evaluate_generation(gen_dir, args.test_case, args.judges, criteria))
+    if cache_file:
+        save_score_cache(cache_file)
     winners = select_winners(results, keep_top)
 
     if args.output_file:
-        Path(args.output_file).write_text(json.dumps({
+        Path(args.output_file).write_text(json_dumps({
             "test_case": args.test_case,
             "criteria": criteria,
             "results": results,
             "winners": [w["skill"] for w in winners]
-        }, indent=2))
+        }))
 
 
 if __name__ == "__main__":
@@ -1,23 +1,142 @@
 #!/usr/bin/env python3
 """Utility functions for skill evolution"""
 
+import asyncio
+import functools
+import json
+import logging
+import os
+import tempfile
 import yaml
-from typing import Tuple, List
+from pathlib import Path
+from typing import Any, Tuple, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# LLM CLIs that read the prompt from stdin when no prompt file is given;
+# any other CLI gets the prompt through a temp file
+STDIN_PROMPT_CLIS = frozenset({"claude"})
+
+DEFAULT_LLM_CONCURRENCY = 8
+
+
+def _env_llm_concurrency() -> int:
+    """Read LLM_CONCURRENCY, falling back to the default if it is not a positive int"""
+    value = os.getenv("LLM_CONCURRENCY")
+    if value is None:
+        return DEFAULT_LLM_CONCURRENCY
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        logger.warning(
+            f"Ignoring invalid LLM_CONCURRENCY={value!r}, using {DEFAULT_LLM_CONCURRENCY}"
+        )
+        return DEFAULT_LLM_CONCURRENCY
+    return limit
+
+
+# Maximum LLM CLI subprocesses running at once (mutations and judges)
+LLM_CONCURRENCY = _env_llm_concurrency()
+
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def llm_semaphore() -> asyncio.Semaphore:
+    """Shared semaphore bounding concurrent LLM calls.
+
+    Created on first use so it belongs to the running event loop.
+    """
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+    return _llm_semaphore
+
+
+async def run_prompt_cli(cmd: List[str], file_flag: str, prompt: str) -> Tuple[int, bytes]:
+    """Run an LLM CLI on prompt and return (returncode, stdout)
+
+    The prompt is piped on stdin for CLIs in STDIN_PROMPT_CLIS. Other CLIs
+    get it in a temp file passed as `file_flag <path>`. The subprocess runs
+    under llm_semaphore().
+    """
+    data = prompt.encode('utf-8')
+    if cmd[0] in STDIN_PROMPT_CLIS:
+        async with llm_semaphore():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            stdout, _ = await proc.communicate(data)
+        return proc.returncode, stdout
+
+    with tempfile.NamedTemporaryFile(mode='wb', suffix='.txt', delete=False) as f:
+        f.write(data)
+        prompt_file = f.name
+    try:
+        async with llm_semaphore():
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, file_flag, prompt_file,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            stdout, _ = await proc.communicate()
+        return proc.returncode, stdout
+    finally:
+        Path(prompt_file).unlink(missing_ok=True)
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON text (2-space indent by default), using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
 
 
 def validate_skill(content: str) -> Tuple[bool, List[str]]:
-    """Validate skill markdown structure with comprehensive checks"""
+    """Validate skill markdown structure with comprehensive checks
+
+    Results are cached by content, so revalidating identical variants is a
+    dict lookup.
+    """
+    valid, errors = _validate_skill_cached(content)
+    return valid, list(errors)
+
+
+@functools.lru_cache(maxsize=2048)
+def _validate_skill_cached(content: str) -> Tuple[bool, Tuple[str, ...]]:
+    """Cached validation; errors are a tuple so cached entries stay immutable"""
+    valid, errors = _validate_skill_uncached(content)
+    return valid, tuple(errors)
+
+
+def _validate_skill_uncached(content: str) -> Tuple[bool, List[str]]:
+    """Run every validation check on content"""
     errors = []
 
     if not content.startswith('---'):
         return False, ["Missing YAML frontmatter"]
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    # Same boundaries as content.split('---', 2), without building the list
+    fm_end = content.find('---', 3)
+    if fm_end == -1:
         return False, ["Malformed frontmatter"]
 
     try:
-        meta = yaml.safe_load(parts[1])
+        meta = yaml.load(content[3:fm_end], Loader=_YAML_LOADER)
         if not isinstance(meta, dict):
             errors.append("Frontmatter not a dict")
         if 'name' not in meta:
@@ -31,7 +150,7 @@ def validate_skill(content: str) -> Tuple[bool, List[str]]:
     except yaml.YAMLError as e:
         return False, [f"Invalid YAML: {e}"]
 
-    body = parts[2].strip()
+    body = content[fm_end + 3:].strip()
     if len(body) < 100:
         errors.append("Body too short (< 100 chars)")
     if '# ' not in body:
@@ -40,14 +159,31 @@ def validate_skill(content: str) -> Tuple[bool, List[str]]:
     # Additional quality checks
     if len(body) < 500:
         errors.append("Body lacks substance (< 500 chars)")
-    if body.count('##') < 2:
+    # Only two subsection markers are needed; stop at the second rather
+    # than counting every one in the body
+    first_h2 = body.find('##')
+    if first_h2 == -1 or body.find('##', first_h2 + 2) == -1:
         errors.append("Insufficient structure (< 2 subsections)")
 
     return len(errors) == 0, errors
 
 
+# Weights used when a criteria string yields nothing usable
+_DEFAULT_CRITERIA = {"correctness": 30, "clarity": 25, "usability": 25, "efficiency": 20}
+
+
 def parse_criteria_safe(criteria_str: str) -> dict:
-    """Safely parse criteria string into weighted dict"""
+    """Safely parse criteria string into weighted dict
+
+    Parsing is cached per string; each call returns a fresh dict the caller
+    may modify.
+    """
+    return dict(_parse_criteria_cached(criteria_str)) or _DEFAULT_CRITERIA.copy()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_criteria_cached(criteria_str: str) -> Tuple[Tuple[str, int], ...]:
+    """Parse criteria string into (name, weight) pairs"""
     criteria = {}
     for item in criteria_str.split(','):
         item = item.strip()
@@ -58,13 +194,22 @@ def parse_criteria_safe(criteria_str: str) -> dict:
             criteria[k.strip()] = int(v.strip())
         except ValueError:
             continue
-    return criteria if criteria else {"correctness": 30, "clarity": 25, "usability": 25, "efficiency": 20}
+    return tuple(criteria.items())
 
 
 def calculate_metrics(variants: List) -> dict:
     """Calculate evolution metrics for reporting"""
-    valid_count = sum(1 for v in variants if hasattr(v, 'is_valid') and v.is_valid())
-    avg_length = sum(len(v.content) for v in variants if hasattr(v, 'content')) / max(len(variants), 1)
+    # Single pass; is_valid() is cached on SkillVariant, so no re-parsing here
+    valid_count = 0
+    total_length = 0
+    for v in variants:
+        is_valid = getattr(v, 'is_valid', None)
+        if is_valid is not None and is_valid():
+            valid_count += 1
+        content = getattr(v, 'content', None)
+        if content is not None:
+            total_length += len(content)
+    avg_length = total_length / max(len(variants), 1)
     
     return {
         "total_variants": len(variants),
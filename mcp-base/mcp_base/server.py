@@ -4,6 +4,18 @@ import asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+try:
+    import uvloop
+except ImportError:  # optional, see the "fast" extra (not available on Windows)
+    uvloop = None
+
+
+def _run(coro):
+    """Run coro to completion, on a uvloop event loop when uvloop is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 
 def create_server(name: str, tools: list, execute_func):
     """Create MCP server with standard configuration.
@@ -16,6 +28,8 @@ def create_server(name: str, tools: list, execute_func):
     Returns:
         Configured Server instance and main function
     """
+    # Snapshot the definitions once; every listing returns the same tuple
+    tools = tuple(tools)
     app = Server(name)
 
     @app.list_tools()
@@ -31,6 +45,6 @@ def create_server(name: str, tools: list, execute_func):
             await app.run(read_stream, write_stream, app.create_initialization_options())
 
     def main():
-        asyncio.run(run())
+        _run(run())
 
     return app, main
@@ -5,6 +5,7 @@ Copy and customize for your own tools.
 """
 
 import json
+import os
 import click
 
 from . import constants
@@ -118,13 +119,19 @@ def cache_status() -> None:
       my-tool cache status
     """
     status = {
-        "cache_dir": str(constants.CACHE_DIR),
-        "cache_file": str(constants.CACHE_FILE),
-        "exists": constants.CACHE_FILE.exists(),
+        "cache_dir": constants.CACHE_DIR_STR,
+        "cache_file": constants.CACHE_FILE_STR,
+        "exists": False,
     }
 
-    if status["exists"]:
-        status["size_bytes"] = constants.CACHE_FILE.stat().st_size
+    # One stat() answers both "exists" and "size"
+    try:
+        size_bytes = os.stat(constants.CACHE_FILE_STR).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    else:
+        status["exists"] = True
+        status["size_bytes"] = size_bytes
 
     click.echo(f"Cache directory: {status['cache_dir']}")
     click.echo(f"Cache file: {status['cache_file']}")
@@ -156,10 +163,9 @@ def _format_output(data: dict, fmt: str) -> str:
     if fmt == "json":
         return json.dumps(data, indent=2)
     elif fmt == "table":
-        lines = ["Key                  Value", "-" * 40]
-        for key, value in data.items():
-            lines.append(f"{key:<20} {value}")
-        return "\n".join(lines)
+        return "\n".join(
+            [constants.TABLE_HEADER, *(f"{key:<20} {value}" for key, value in data.items())]
+        )
     else:
         # Compact format
         return " | ".join(f"{k}={v}" for k, v in data.items())
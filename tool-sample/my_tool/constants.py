@@ -7,9 +7,14 @@ CACHE_DIR = Path("/tmp/my-tool-cache")
 CACHE_FILE = CACHE_DIR / "data.json"
 METADATA_FILE = CACHE_DIR / "metadata.json"
 
+# String forms for status reporting and os.stat, computed once at import
+CACHE_DIR_STR = str(CACHE_DIR)
+CACHE_FILE_STR = str(CACHE_FILE)
+
 # Output formats
 OUTPUT_FORMATS = ("json", "table", "compact")
 DEFAULT_FORMAT = "json"
+TABLE_HEADER = "Key                  Value\n" + "-" * 40
 
 # API configuration (example)
 DEFAULT_TIMEOUT = 30
@@ -7,6 +7,11 @@ import asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
+try:
+    import uvloop
+except ImportError:  # optional, see the "fast" extra (not available on Windows)
+    uvloop = None
+
 from .tools import TOOLS, execute_tool
 
 app = Server("my-tool")
@@ -24,9 +29,22 @@ async def call_tool(name: str, arguments: dict):
     return await execute_tool(name, arguments)
 
 
+def _run(coro):
+    """Run coro to completion, on a uvloop event loop when uvloop is installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+async def run():
+    """Serve MCP requests over stdio until the client disconnects."""
+    async with stdio_server() as (read_stream, write_stream):
+        await app.run(read_stream, write_stream, app.create_initialization_options())
+
+
 def main():
     """Entry point for MCP server."""
-    asyncio.run(stdio_server(app))
+    _run(run())
 
 
 if __name__ == "__main__":
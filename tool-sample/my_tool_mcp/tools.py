@@ -6,7 +6,9 @@ Define your MCP tools here. Each tool should have:
 - inputSchema: JSON Schema for the tool's parameters
 """
 
+import inspect
 import json
+import os
 from typing import Any
 
 from mcp.types import Tool, TextContent
@@ -14,8 +16,22 @@ from mcp.types import Tool, TextContent
 from my_tool import constants
 from my_tool.exceptions import MyToolError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
-TOOLS = [
+
+def _dumps(obj: Any) -> str:
+    """Serialize a response payload as 2-space indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    # Match orjson's output, which keeps non-ASCII text as-is
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+# Fixed at import; a tuple so the served tool list cannot be mutated
+TOOLS = (
     Tool(
         name="my_tool_hello",
         description="""Say hello to someone.
@@ -75,7 +91,7 @@ TOOLS = [
             "properties": {},
         },
     ),
-]
+)
 
 
 async def execute_tool(name: str, arguments: dict) -> Any:
@@ -84,14 +100,13 @@ async def execute_tool(name: str, arguments: dict) -> Any:
     Routes tool calls to appropriate handlers and formats responses.
     """
     try:
-        if name == "my_tool_hello":
-            return await hello_handler(arguments)
-        elif name == "my_tool_process":
-            return await process_handler(arguments)
-        elif name == "my_tool_cache_status":
-            return await cache_status_handler(arguments)
-        else:
+        entry = _HANDLERS.get(name)
+        if entry is None:
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
+        handler, is_async = entry
+        if is_async:
+            return await handler(arguments)
+        return handler(arguments)
 
     except MyToolError as e:
         return [TextContent(type="text", text=f"Error: {e}")]
@@ -99,49 +114,70 @@ async def execute_tool(name: str, arguments: dict) -> Any:
         return [TextContent(type="text", text=f"Unexpected error: {e}")]
 
 
-async def hello_handler(arguments: dict) -> list[TextContent]:
+def hello_handler(arguments: dict) -> list[TextContent]:
     """Handle hello tool calls."""
     name = arguments.get("name", "World")
     result = f"Hello, {name}!"
     return [TextContent(type="text", text=result)]
 
 
-async def process_handler(arguments: dict) -> list[TextContent]:
+def process_handler(arguments: dict) -> list[TextContent]:
     """Handle process tool calls."""
     input_text = arguments["input"]
     fmt = arguments.get("format", "json")
 
     # Process the input
-    result = {
-        "input": input_text,
-        "length": len(input_text),
-        "words": len(input_text.split()),
-        "uppercase": input_text.upper(),
-    }
+    length = len(input_text)
+    words = len(input_text.split())
+    uppercase = input_text.upper()
 
-    # Format output
+    # Format output; the fixed fields are formatted directly and a dict is
+    # only built for JSON
     if fmt == "json":
-        output = json.dumps(result, indent=2)
+        result = {"input": input_text, "length": length, "words": words, "uppercase": uppercase}
+        output = _dumps(result)
     elif fmt == "table":
-        lines = ["Key                  Value", "-" * 40]
-        for key, value in result.items():
-            lines.append(f"{key:<20} {value}")
-        output = "\n".join(lines)
+        output = (
+            f"{constants.TABLE_HEADER}\n"
+            f"{'input':<20} {input_text}\n"
+            f"{'length':<20} {length}\n"
+            f"{'words':<20} {words}\n"
+            f"{'uppercase':<20} {uppercase}"
+        )
     else:
-        output = " | ".join(f"{k}={v}" for k, v in result.items())
+        output = f"input={input_text} | length={length} | words={words} | uppercase={uppercase}"
 
     return [TextContent(type="text", text=output)]
 
 
-async def cache_status_handler(arguments: dict) -> list[TextContent]:
+def cache_status_handler(arguments: dict) -> list[TextContent]:
     """Handle cache status tool calls."""
     status = {
-        "cache_dir": str(constants.CACHE_DIR),
-        "cache_file": str(constants.CACHE_FILE),
-        "exists": constants.CACHE_FILE.exists(),
+        "cache_dir": constants.CACHE_DIR_STR,
+        "cache_file": constants.CACHE_FILE_STR,
+        "exists": False,
     }
 
-    if status["exists"]:
-        status["size_bytes"] = constants.CACHE_FILE.stat().st_size
-
-    return [TextContent(type="text", text=json.dumps(status, indent=2))]
+    # One stat() answers both "exists" and "size"
+    try:
+        size_bytes = os.stat(constants.CACHE_FILE_STR).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    else:
+        status["exists"] = True
+        status["size_bytes"] = size_bytes
+
+    return [TextContent(type="text", text=_dumps(status))]
+
+
+# Tool name -> (handler, is_async); register new tools here alongside their
+# TOOLS entry. Handlers without I/O can be plain functions and skip the
+# coroutine round trip; async handlers are awaited.
+_HANDLERS = {
+    name: (handler, inspect.iscoroutinefunction(handler))
+    for name, handler in {
+        "my_tool_hello": hello_handler,
+        "my_tool_process": process_handler,
+        "my_tool_cache_status": cache_status_handler,
+    }.items()
+}
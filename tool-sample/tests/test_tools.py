@@ -0,0 +1,32 @@
+"""MCP tool tests for my-tool."""
+
+import asyncio
+
+from my_tool_mcp.tools import TOOLS, execute_tool
+
+
+def _call(name, arguments):
+    """Run a tool call and return the text of its first content item."""
+    return asyncio.run(execute_tool(name, arguments))[0].text
+
+
+class TestExecuteTool:
+    """Test tool dispatch."""
+
+    def test_every_tool_has_handler(self):
+        """Test every listed tool is routed to a handler."""
+        for tool in TOOLS:
+            assert not _call(tool.name, {"name": "x", "input": "x"}).startswith("Unknown tool")
+
+    def test_hello(self):
+        """Test hello tool."""
+        assert _call("my_tool_hello", {"name": "World"}) == "Hello, World!"
+
+    def test_process_compact(self):
+        """Test process tool with compact output."""
+        output = _call("my_tool_process", {"input": "a b", "format": "compact"})
+        assert "words=2" in output
+
+    def test_unknown_tool(self):
+        """Test unknown tool name."""
+        assert _call("nope", {}) == "Unknown tool: nope"